@@ -6,25 +6,27 @@ investor-focused reports using AI-powered analysis.
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-import time
+import asyncio
 import logging
-from typing import Optional, List, Dict
+import re
+import hashlib
+from typing import Optional, List, Dict, Tuple, Callable
 
 from financial_agent.data_fetcher import DataFetcher
 from financial_agent.analyzer import SentimentAnalyzer, SentimentReport
+from financial_agent.secrets import config
 
-def get_config():
-    from financial_agent.secrets import Config
-    return Config()
+logger = logging.getLogger(__name__)
 
-config = get_config()
+ANALYSIS_STEPS = 4
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+SENTIMENT_COLORS = {
+    'Positive': '#28a745',
+    'Negative': '#dc3545',
+    'Neutral': '#ffc107'
+}
 
 st.set_page_config(
     page_title="Financial Sentiment Analyst",
@@ -202,27 +204,26 @@ def display_company_input():
     
     return company_name, analyze_button
 
-def display_loading_animation():
-    """Display loading animation during analysis."""
-    with st.spinner("Analyzing market sentiment..."):
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        steps = [
-            "🔍 Searching for company ticker...",
-            "📰 Fetching recent news articles...",
-            "🤖 Analyzing sentiment with AI...",
-            "📊 Generating comprehensive report...",
-            "✅ Analysis complete!"
-        ]
-        
-        for i, step in enumerate(steps):
-            progress_bar.progress((i + 1) / len(steps))
-            status_text.text(step)
-            time.sleep(0.5)
-        
+def create_progress_callback() -> Tuple[Callable[[int, str], None], Callable[[], None]]:
+    """
+    Create a progress display driven by the analysis pipeline stages.
+    
+    Returns:
+        Tuple of (progress_callback, clear) where progress_callback(step, label)
+        updates the progress bar and clear() removes it
+    """
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    
+    def progress_callback(step: int, label: str):
+        progress_bar.progress(step / ANALYSIS_STEPS)
+        status_text.text(label)
+    
+    def clear():
         progress_bar.empty()
         status_text.empty()
+    
+    return progress_callback, clear
 
 def display_company_info(company_info: Dict):
     """Display company information."""
@@ -266,38 +267,30 @@ def display_sentiment_charts(report: SentimentReport):
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_pie = px.pie(
+        sentiments = list(report.sentiment_breakdown)
+        fig_pie = go.Figure(go.Pie(
+            labels=sentiments,
             values=list(report.sentiment_breakdown.values()),
-            names=list(report.sentiment_breakdown.keys()),
-            title="Sentiment Distribution",
-            color_discrete_map={
-                'Positive': '#28a745',
-                'Negative': '#dc3545',
-                'Neutral': '#ffc107'
-            }
-        )
-        fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+            marker_colors=[SENTIMENT_COLORS.get(sentiment) for sentiment in sentiments],
+            textposition='inside',
+            textinfo='percent+label'
+        ))
+        fig_pie.update_layout(title="Articles by Sentiment")
         st.plotly_chart(fig_pie, use_container_width=True)
     
     with col2:
-        sentiment_df = pd.DataFrame([
-            {'Sentiment': k, 'Percentage': v} 
-            for k, v in report.sentiment_percentages.items()
-        ])
-        
-        fig_bar = px.bar(
-            sentiment_df,
-            x='Sentiment',
-            y='Percentage',
-            title="Sentiment Percentages",
-            color='Sentiment',
-            color_discrete_map={
-                'Positive': '#28a745',
-                'Negative': '#dc3545',
-                'Neutral': '#ffc107'
-            }
+        sentiments = list(report.sentiment_percentages)
+        fig_bar = go.Figure(go.Bar(
+            x=sentiments,
+            y=list(report.sentiment_percentages.values()),
+            marker_color=[SENTIMENT_COLORS.get(sentiment) for sentiment in sentiments]
+        ))
+        fig_bar.update_layout(
+            title="Confidence-Weighted Sentiment",
+            xaxis_title="Sentiment",
+            yaxis_title="Weighted Share (%)",
+            showlegend=False
         )
-        fig_bar.update_layout(showlegend=False)
         st.plotly_chart(fig_bar, use_container_width=True)
     
     sentiment_class = report.overall_sentiment.lower()
@@ -306,7 +299,7 @@ def display_sentiment_charts(report: SentimentReport):
     st.markdown(f"""
     <div class="metric-card">
         <h2>Overall Sentiment: {sentiment_emoji.get(sentiment_class, '➡️')} {report.overall_sentiment}</h2>
-        <p>Based on analysis of {report.analyzed_articles} articles</p>
+        <p>Confidence-weighted across {report.analyzed_articles} analyzed articles</p>
     </div>
     """, unsafe_allow_html=True)
 
@@ -341,45 +334,155 @@ def display_analysis_details(report: SentimentReport):
             st.metric("Analysis Timestamp", report.analysis_timestamp)
         
         st.subheader("Detailed Sentiment Breakdown")
-        sentiment_df = pd.DataFrame([
-            {
-                'Sentiment': sentiment,
-                'Count': count,
-                'Percentage': f"{percentage:.1f}%"
+        st.dataframe(
+            report.sentiment_df,
+            use_container_width=True,
+            column_config={
+                'Percentage': st.column_config.NumberColumn(
+                    "Weighted %", format="%.1f%%",
+                    help="Share of total confidence; the overall sentiment is based on these values"
+                )
             }
-            for sentiment, count in report.sentiment_breakdown.items()
-            for percentage in [report.sentiment_percentages.get(sentiment, 0)]
-        ])
-        st.dataframe(sentiment_df, use_container_width=True)
+        )
+
+@st.cache_resource(show_spinner=False)
+def get_data_fetcher(news_api_key: str) -> DataFetcher:
+    """Create the DataFetcher once and reuse it (and its HTTP session) across reruns."""
+    return DataFetcher(news_api_key)
+
+@st.cache_resource(show_spinner=False)
+def get_analyzer(google_ai_api_key: str) -> SentimentAnalyzer:
+    """Create the SentimentAnalyzer once and reuse its model and rate limiter across reruns."""
+    return SentimentAnalyzer(google_ai_api_key)
+
+class NoDataError(Exception):
+    """Raised by the cached fetch wrappers so empty results are not memoized."""
+
+def _require(value, message: str):
+    """Return value, or raise NoDataError if it is empty (st.cache_data does not cache exceptions)."""
+    if not value:
+        raise NoDataError(message)
+    return value
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_ticker(company_name: str) -> str:
+    """Map a company name to its ticker symbol, cached across reruns."""
+    return _require(
+        get_data_fetcher(config.news_api_key).get_ticker(company_name),
+        "Could not find ticker symbol for the given company name."
+    )
 
-def perform_analysis(company_name: str, config_params: Dict) -> tuple:
-    """Perform the complete sentiment analysis."""
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_company_info(ticker: str) -> Dict:
+    """Fetch company information for a ticker, cached across reruns."""
+    return _require(
+        get_data_fetcher(config.news_api_key).get_company_info(ticker),
+        f"No company information found for {ticker}."
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_news(company_name: str, days_back: int) -> List[Dict]:
+    """Fetch recent news articles for a company, cached across reruns."""
+    return _require(
+        get_data_fetcher(config.news_api_key).fetch_news_from_api(company_name, days_back),
+        "No recent news articles found for this company."
+    )
+
+def deduplicate_articles(articles: List[Dict]) -> List[Dict]:
+    """
+    Drop repeated stories before they reach the LLM.
+    
+    Articles are considered duplicates when they share a URL or a normalized
+    title (wire reposts). NewsAPI returns newest first, so the most recent
+    copy of each story is kept.
+    
+    Args:
+        articles: List of articles as returned by the data fetcher
+        
+    Returns:
+        List of unique articles in their original order
+    """
+    seen = set()
+    unique_articles = []
+    
+    for article in articles:
+        keys = []
+        if article.get('url'):
+            keys.append(('url', article['url']))
+        
+        normalized_title = re.sub(r'\W+', '', (article.get('title') or '').lower())
+        if normalized_title:
+            title_hash = hashlib.blake2b(normalized_title.encode('utf-8'), digest_size=8).digest()
+            keys.append(('title', title_hash))
+        
+        if any(key in seen for key in keys):
+            continue
+        
+        seen.update(keys)
+        unique_articles.append(article)
+    
+    return unique_articles
+
+def perform_analysis(company_name: str, config_params: Dict,
+                     progress_callback: Optional[Callable[[int, str], None]] = None) -> tuple:
+    """
+    Perform the complete sentiment analysis.
+    
+    Args:
+        company_name: Name of the company to analyze
+        config_params: Analysis parameters from the sidebar
+        progress_callback: Optional callable invoked as (step, label) after each
+            of the ANALYSIS_STEPS pipeline stages completes
+    """
+    def report_progress(step: int, label: str):
+        if progress_callback:
+            progress_callback(step, label)
+    
     try:
-        data_fetcher = DataFetcher(config.news_api_key)
-        analyzer = SentimentAnalyzer(config.google_ai_api_key)
+        analyzer = get_analyzer(config.google_ai_api_key)
         
-        ticker = data_fetcher.get_ticker(company_name)
-        if not ticker:
-            return None, None, "Could not find ticker symbol for the given company name."
+        try:
+            ticker = fetch_ticker(company_name)
+        except NoDataError as e:
+            return None, None, str(e)
         
-        company_info = data_fetcher.get_company_info(ticker)
+        try:
+            company_info = fetch_company_info(ticker)
+        except NoDataError as e:
+            logger.warning(str(e))
+            company_info = None
+        report_progress(1, f"🔍 Found ticker {ticker}, fetching recent news articles...")
         
-        articles = data_fetcher.fetch_news_from_api(company_name, config_params['days_back'])
-        if not articles:
-            return company_info, None, "No recent news articles found for this company."
+        try:
+            articles = fetch_news(company_name, config_params['days_back'])
+        except NoDataError as e:
+            return company_info, None, str(e)
 
-        articles = articles[:config_params['max_articles']]
+        articles = deduplicate_articles(articles)[:config_params['max_articles']]
+        report_progress(2, f"📰 Fetched {len(articles)} articles, analyzing sentiment with AI...")
 
-        sentiment_results = []
-        for i, article in enumerate(articles):
-            result = analyzer.analyze_article_sentiment(article)
-            if result:
-                sentiment_results.append(result)
+        streamed_results = []
+        
+        def on_result(result):
+            streamed_results.append(result)
+            report_progress(2, f"🤖 Analyzed {len(streamed_results)}/{len(articles)} articles "
+                               f"({result.sentiment}): {result.article_title[:60]}")
+        
+        batch_analysis = analyzer.analyze_articles_fused(articles, company_name, on_result)
+        if batch_analysis:
+            sentiment_results = batch_analysis.sentiment_results
+            bull_bear_cases = (batch_analysis.bull_case, batch_analysis.bear_case)
+        else:
+            logger.warning("Batch analysis failed, falling back to per-article analysis")
+            sentiment_results = asyncio.run(analyzer.analyze_articles_async(articles))
+            bull_bear_cases = None
         
         if not sentiment_results:
             return company_info, None, "Could not analyze sentiment for any articles."
+        report_progress(3, f"🤖 Analyzed {len(sentiment_results)} articles, generating comprehensive report...")
         
-        report = analyzer.generate_final_report(sentiment_results, company_name)
+        report = analyzer.generate_final_report(sentiment_results, company_name, bull_bear_cases)
+        report_progress(4, "✅ Analysis complete!")
         
         return company_info, report, None
         
@@ -402,9 +505,13 @@ def main():
         if not company_name.strip():
             st.error("Please enter a company name.")
         else:
-            display_loading_animation()
-            
-            company_info, report, error = perform_analysis(company_name.strip(), config_params)
+            with st.spinner("Analyzing market sentiment..."):
+                progress_callback, clear_progress = create_progress_callback()
+                progress_callback(0, "🔍 Searching for company ticker...")
+                company_info, report, error = perform_analysis(
+                    company_name.strip(), config_params, progress_callback
+                )
+                clear_progress()
             
             if error:
                 st.error(f"❌ {error}")
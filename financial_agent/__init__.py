@@ -5,5 +5,12 @@ A comprehensive tool for analyzing financial news sentiment and generating
 investor-focused reports using AI-powered analysis.
 """
 
+import logging
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
+
+logging.getLogger('google.generativeai').setLevel(logging.WARNING)
+
 __version__ = "1.0.0"
 __author__ = "Financial Sentiment Analyst"
@@ -6,15 +6,90 @@ Handles AI-powered sentiment analysis using Google's Gemini API.
 
 import logging
 import json
+import math
 import time
-from typing import List, Dict, Optional, Tuple
+import asyncio
+import re
+import html
+import hashlib
+import threading
+from typing import List, Dict, Optional, Tuple, Callable
+import aiohttp
+import diskcache
+import orjson
+import numpy as np
+import pandas as pd
 import google.generativeai as genai
-from dataclasses import dataclass
-from collections import Counter
+from dataclasses import dataclass, asdict
+from collections import deque
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_JSON_FENCE_RE = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_TRUNCATION_MARKER_RE = re.compile(r"\s*(?:…|\.\.\.)?\s*\[\+\d+ chars\]\s*$")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+MAX_CONTENT_CHARS = 1500
+
+GEMINI_REST_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+
+ANALYSIS_PROMPT_TEMPLATE = """You are a senior financial analyst with expertise in market sentiment analysis. 
+Analyze the following news article from an investor's perspective and determine its sentiment regarding the company.
+
+Article Text:
+{text}
+
+Instructions:
+1. Determine the overall sentiment as either "Positive", "Negative", or "Neutral"
+2. Provide clear reasoning for your sentiment classification
+3. Consider factors like:
+   - Financial performance implications
+   - Market impact potential
+   - Strategic developments
+   - Regulatory or competitive threats
+   - Growth prospects
+   - Risk factors
+
+Return your analysis in the following JSON format:
+{{
+    "sentiment": "Positive/Negative/Neutral",
+    "reasoning": "Detailed explanation of your sentiment analysis",
+    "confidence": 0.85
+}}
+
+Be objective and focus on investment implications rather than general news sentiment."""
+
+SENTIMENT_LABELS = ('Positive', 'Negative', 'Neutral')
+SENTIMENT_CODES = {label: code for code, label in enumerate(SENTIMENT_LABELS)}
+NEUTRAL_CODE = SENTIMENT_CODES['Neutral']
+
+def aggregate_sentiment(codes: np.ndarray, confidences: np.ndarray,
+                        threshold: float = 40.0) -> Tuple[int, np.ndarray]:
+    """
+    Aggregate per-article sentiment codes into an overall verdict.
+    
+    Args:
+        codes: Array of sentiment codes (indices into SENTIMENT_LABELS)
+        confidences: Array of per-article confidences used as weights
+        threshold: Minimum weighted share (percent) needed for a non-neutral verdict
+        
+    Returns:
+        Tuple of (overall_code, weighted percentages per code)
+    """
+    weights = np.bincount(codes, weights=confidences, minlength=len(SENTIMENT_LABELS))
+    total = weights.sum()
+    if total <= 0:
+        return NEUTRAL_CODE, np.zeros(len(SENTIMENT_LABELS))
+    
+    percentages = weights / total * 100
+    best = int(percentages.argmax())
+    if percentages[best] < threshold:
+        return NEUTRAL_CODE, percentages
+    
+    return best, percentages
+
 @dataclass
 class SentimentResult:
     """Data class for sentiment analysis results."""
@@ -29,41 +104,147 @@ class SentimentReport:
     """Data class for final sentiment report."""
     overall_sentiment: str
     sentiment_breakdown: Dict[str, int]
-    sentiment_percentages: Dict[str, float]
+    sentiment_percentages: Dict[str, float]  # confidence-weighted, as used for overall_sentiment
     bull_case: List[str]
     bear_case: List[str]
     total_articles: int
     analyzed_articles: int
     analysis_timestamp: str
+    sentiment_df: Optional[pd.DataFrame] = None
+
+@dataclass
+class BatchAnalysis:
+    """Data class for a batched analysis of several articles."""
+    sentiment_results: List[SentimentResult]
+    bull_case: List[str]
+    bear_case: List[str]
+
+class StreamingArrayParser:
+    """Incrementally decodes the items of a JSON array while its text streams in."""
+    
+    def __init__(self, key: str):
+        """
+        Initialize the StreamingArrayParser.
+        
+        Args:
+            key: Name of the object key holding the array to decode
+        """
+        self._key_re = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = None
+        self._done = False
+    
+    @property
+    def text(self) -> str:
+        """All text fed to the parser so far."""
+        return self._buffer
+    
+    def feed(self, text: str) -> List:
+        """
+        Add streamed text and decode any array items completed by it.
+        
+        Args:
+            text: Next chunk of the streamed response
+            
+        Returns:
+            List of newly completed array items
+        """
+        self._buffer += text
+        items = []
+        
+        if self._done:
+            return items
+        
+        if self._pos is None:
+            match = self._key_re.search(self._buffer)
+            if not match:
+                return items
+            self._pos = match.end()
+        
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n,':
+                self._pos += 1
+            
+            if self._pos >= len(self._buffer):
+                break
+            
+            if self._buffer[self._pos] == ']':
+                self._done = True
+                break
+            
+            try:
+                item, self._pos = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                break
+            
+            items.append(item)
+        
+        return items
 
 class SentimentAnalyzer:
     """Handles sentiment analysis using Google's Gemini API."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, requests_per_minute: int = 15,
+                 cache_dir: str = './.sentiment_cache', cache_ttl: int = 3600):
         """
         Initialize the SentimentAnalyzer.
         
         Args:
             api_key: Google AI API key
+            requests_per_minute: Maximum Gemini requests allowed per 60s window
+            cache_dir: Directory of the on-disk cache for Gemini results
+            cache_ttl: Seconds a cached Gemini result stays valid
+        
+        Generation runs at temperature 0 so identical prompts give identical
+        answers, which is what makes the on-disk cache valid.
         """
         self.api_key = api_key
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        self.model_name = 'gemini-1.5-flash'
+        self.generation_config = {'temperature': 0}
+        self.model = genai.GenerativeModel(self.model_name, generation_config=self.generation_config)
+        self._prompt_template = ANALYSIS_PROMPT_TEMPLATE
+        
+        self.requests_per_minute = requests_per_minute
+        self.rate_limit_window = 60.0
+        self._request_times = deque()
+        self._rate_lock = threading.Lock()
+        
+        self.cache = diskcache.Cache(cache_dir)
+        self.cache_ttl = cache_ttl
+        self._cache_namespace = f"{self.model_name}:{json.dumps(self.generation_config, sort_keys=True)}"
+    
+    def _reserve_request_slot(self) -> float:
+        """
+        Reserve the next request slot in the shared token bucket.
         
-        self.last_request_time = 0
-        self.min_request_interval = 5.0 
+        Up to ``requests_per_minute`` calls may start immediately; once the
+        bucket for the current window is empty, the slot is scheduled for when
+        the oldest reservation expires.
+        
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._rate_lock:
+            current_time = time.time()
+            while self._request_times and current_time - self._request_times[0] >= self.rate_limit_window:
+                self._request_times.popleft()
+            
+            if len(self._request_times) >= self.requests_per_minute:
+                start_time = self._request_times.popleft() + self.rate_limit_window
+            else:
+                start_time = current_time
+            
+            self._request_times.append(start_time)
+            return max(0.0, start_time - current_time)
     
     def _rate_limit(self):
         """Implement rate limiting for API requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
+        sleep_time = self._reserve_request_slot()
+        if sleep_time > 0:
             logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
             time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
     
     def analyze_article_sentiment(self, article: Dict) -> Optional[SentimentResult]:
         """
@@ -76,14 +257,18 @@ class SentimentAnalyzer:
             SentimentResult object or None if analysis fails
         """
         try:
-            self._rate_limit()
-            
             title = article.get('title', '')
-            description = article.get('description', '')
-            content = article.get('content', '')
             source = article.get('source', 'Unknown')
             
-            full_text = f"Title: {title}\n\nDescription: {description}\n\nContent: {content}"
+            cache_key = self._article_cache_key(article)
+            cached = self.cache.get(cache_key)
+            if cached:
+                logger.info(f"Using cached sentiment for article: {title[:50]}...")
+                return SentimentResult(**cached)
+            
+            self._rate_limit()
+            
+            full_text = self._clean_article_text(article)
             
             prompt = self._create_analysis_prompt(full_text)
             
@@ -101,18 +286,368 @@ class SentimentAnalyzer:
                 logger.warning(f"Could not parse sentiment for article: {title}")
                 return None
             
-            return SentimentResult(
+            result = SentimentResult(
                 sentiment=sentiment_data['sentiment'],
                 reasoning=sentiment_data['reasoning'],
                 confidence=sentiment_data.get('confidence', 0.8),
                 article_title=title,
                 article_source=source
             )
+            self.cache.set(cache_key, asdict(result), expire=self.cache_ttl)
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error analyzing article sentiment: {str(e)}")
+            return None
+    
+    async def analyze_articles_async(self, articles: List[Dict]) -> List[SentimentResult]:
+        """
+        Analyze articles one request each, issuing all requests concurrently.
+        
+        Requests go straight to the Gemini REST endpoint over a single
+        keep-alive aiohttp session, while the shared token bucket still
+        paces them. The on-disk cache is blocking, so it is read in one worker
+        thread before the requests start and written from worker threads,
+        never on the event loop.
+        
+        Args:
+            articles: List of article data with title, description, content, etc.
+            
+        Returns:
+            List of SentimentResult objects in article order (failed analyses
+            are omitted)
+        """
+        cache_keys, results = await asyncio.to_thread(self._lookup_cached_results, articles)
+        pending = [index for index, result in enumerate(results) if result is None]
+        
+        if pending:
+            connector = aiohttp.TCPConnector(limit=len(pending), keepalive_timeout=60)
+            timeout = aiohttp.ClientTimeout(total=60)
+            
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                analyzed = await asyncio.gather(
+                    *(self._analyze_async(session, articles[index], cache_keys[index]) for index in pending)
+                )
+            
+            for index, result in zip(pending, analyzed):
+                results[index] = result
+        
+        return [result for result in results if result]
+    
+    def _lookup_cached_results(self, articles: List[Dict]) -> Tuple[List[str], List[Optional[SentimentResult]]]:
+        """
+        Build the cache keys for several articles and read their cached verdicts.
+        
+        Args:
+            articles: List of article data with title, description, content, etc.
+            
+        Returns:
+            Tuple of (cache key per article, cached SentimentResult or None per article)
+        """
+        cache_keys = [self._article_cache_key(article) for article in articles]
+        results = []
+        for article, cache_key in zip(articles, cache_keys):
+            cached = self.cache.get(cache_key)
+            if cached:
+                logger.info(f"Using cached sentiment for article: {article.get('title', '')[:50]}...")
+            results.append(SentimentResult(**cached) if cached else None)
+        
+        return cache_keys, results
+    
+    async def _analyze_async(self, session: aiohttp.ClientSession, 
+                             article: Dict, cache_key: str) -> Optional[SentimentResult]:
+        """
+        Analyze sentiment of a single article through the Gemini REST API.
+        
+        Args:
+            session: Shared aiohttp session
+            article: Article data with title, description, content, etc.
+            cache_key: Cache key the result is stored under
+            
+        Returns:
+            SentimentResult object or None if analysis fails
+        """
+        try:
+            title = article.get('title', '')
+            
+            await asyncio.sleep(self._reserve_request_slot())
+            
+            prompt = self._create_analysis_prompt(self._clean_article_text(article))
+            
+            logger.info(f"Analyzing article: {title[:50]}...")
+            
+            async with session.post(
+                GEMINI_REST_URL.format(model=self.model_name),
+                headers={'x-goog-api-key': self.api_key},
+                json={
+                    'contents': [{'parts': [{'text': prompt}]}],
+                    'generationConfig': self.generation_config
+                }
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+            
+            candidates = data.get('candidates') or [{}]
+            parts = candidates[0].get('content', {}).get('parts', [])
+            response_text = "".join(part.get('text', '') for part in parts)
+            
+            if not response_text:
+                logger.warning(f"No response generated for article: {title}")
+                return None
+            
+            sentiment_data = self._parse_sentiment_response(response_text)
+            
+            if not sentiment_data:
+                logger.warning(f"Could not parse sentiment for article: {title}")
+                return None
+            
+            result = self._build_sentiment_result(sentiment_data, article)
+            await asyncio.to_thread(self.cache.set, cache_key, asdict(result), expire=self.cache_ttl)
+            
+            return result
             
         except Exception as e:
             logger.error(f"Error analyzing article sentiment: {str(e)}")
             return None
     
+    def analyze_articles_batch(self, articles: List[Dict],
+                               on_result: Optional[Callable[[SentimentResult], None]] = None) -> List[SentimentResult]:
+        """
+        Analyze sentiment of several news articles with a single Gemini request.
+        
+        Args:
+            articles: List of article data with title, description, content, etc.
+            on_result: Optional callable invoked with each SentimentResult as soon
+                as it is available, while the response is still streaming
+            
+        Returns:
+            List of SentimentResult objects in article order (articles whose
+            verdict could not be parsed are omitted)
+        """
+        batch_analysis = self._run_batch_analysis(articles, on_result=on_result)
+        return batch_analysis.sentiment_results if batch_analysis else []
+    
+    def analyze_articles_fused(self, articles: List[Dict], company_name: str,
+                               on_result: Optional[Callable[[SentimentResult], None]] = None) -> Optional[BatchAnalysis]:
+        """
+        Analyze all articles and synthesize Bull/Bear cases in a single Gemini request.
+        
+        Args:
+            articles: List of article data with title, description, content, etc.
+            company_name: Name of the company being analyzed
+            on_result: Optional callable invoked with each SentimentResult as soon
+                as it is available, while the response is still streaming
+            
+        Returns:
+            BatchAnalysis with per-article results and Bull/Bear cases, or None
+            if no article could be analyzed
+        """
+        return self._run_batch_analysis(articles, company_name, on_result)
+    
+    def _run_batch_analysis(self, articles: List[Dict], 
+                            company_name: Optional[str] = None,
+                            on_result: Optional[Callable[[SentimentResult], None]] = None) -> Optional[BatchAnalysis]:
+        """
+        Send articles to Gemini in one request and map the verdicts back.
+        
+        Articles with a cached verdict are not sent again. When Bull/Bear cases
+        are requested but not cached, every article is included so the cases
+        are based on the full set. The response is streamed so per-article
+        verdicts can be reported through on_result before it completes.
+        
+        Args:
+            articles: List of articles to analyze
+            company_name: When given, Bull/Bear cases are requested as well
+            on_result: Optional callable invoked with each SentimentResult
+            
+        Returns:
+            BatchAnalysis object or None if analysis fails
+        """
+        if not articles:
+            return None
+        
+        try:
+            article_keys = [self._batch_article_cache_key(article) for article in articles]
+            results_by_index = {}
+            for index, key in enumerate(article_keys):
+                cached = self.cache.get(key)
+                if cached:
+                    results_by_index[index] = SentimentResult(**cached)
+            
+            bull_bear_key = None
+            cached_cases = None
+            if company_name:
+                bull_bear_key = self._cache_key('batch_bull_bear', company_name, *sorted(article_keys))
+                cached_cases = self.cache.get(bull_bear_key)
+            
+            if company_name and cached_cases is None:
+                pending = list(range(len(articles)))
+            else:
+                pending = [index for index in range(len(articles)) if index not in results_by_index]
+            
+            bull_case, bear_case = cached_cases if cached_cases else ([], [])
+            
+            if on_result:
+                for index in sorted(results_by_index):
+                    if index not in pending:
+                        on_result(results_by_index[index])
+            
+            if pending:
+                pending_articles = [articles[index] for index in pending]
+                request_company = company_name if cached_cases is None else None
+                
+                self._rate_limit()
+                
+                prompt = self._create_batch_analysis_prompt(pending_articles, request_company)
+                
+                logger.info(f"Analyzing {len(pending_articles)} articles in a single batch request "
+                            f"({len(articles) - len(pending_articles)} cached)")
+                
+                def emit_streamed(article_id: int, sentiment_data: Dict):
+                    if on_result:
+                        article = pending_articles[article_id - 1]
+                        on_result(self._build_sentiment_result(sentiment_data, article))
+                
+                response_text = self._stream_batch_response(prompt, len(pending_articles), emit_streamed)
+                
+                if not response_text:
+                    logger.warning("No response generated for article batch")
+                    return None
+                
+                batch_data = self._parse_batch_response(response_text, len(pending_articles))
+                
+                if not batch_data:
+                    logger.warning("Could not parse batch sentiment response")
+                    return None
+                
+                for article_id, index in enumerate(pending, start=1):
+                    article = articles[index]
+                    sentiment_data = batch_data['per_article'].get(article_id)
+                    if not sentiment_data:
+                        logger.warning(f"No sentiment returned for article {article_id}: {article.get('title', '')}")
+                        continue
+                    
+                    result = self._build_sentiment_result(sentiment_data, article)
+                    results_by_index[index] = result
+                    self.cache.set(article_keys[index], asdict(result), expire=self.cache_ttl)
+                
+                if request_company:
+                    bull_case, bear_case = batch_data['bull_case'], batch_data['bear_case']
+                    if bull_case and bear_case:
+                        self.cache.set(bull_bear_key, (bull_case, bear_case), expire=self.cache_ttl)
+            else:
+                logger.info(f"Using cached analysis for all {len(articles)} articles")
+            
+            sentiment_results = [results_by_index[index] for index in sorted(results_by_index)]
+            
+            if not sentiment_results:
+                return None
+            
+            return BatchAnalysis(
+                sentiment_results=sentiment_results,
+                bull_case=bull_case,
+                bear_case=bear_case
+            )
+            
+        except Exception as e:
+            logger.error(f"Error analyzing article batch: {str(e)}")
+            return None
+    
+    def _stream_batch_response(self, prompt: str, article_count: int,
+                               on_item: Callable[[int, Dict], None]) -> str:
+        """
+        Stream a batch response from Gemini, decoding per-article entries as they arrive.
+        
+        Args:
+            prompt: Batch analysis prompt
+            article_count: Number of articles in the prompt
+            on_item: Callable invoked as (article_id, sentiment_data) for each
+                entry that decodes before the response completes
+            
+        Returns:
+            Full response text
+        """
+        stream_parser = StreamingArrayParser('per_article')
+        
+        for chunk in self.model.generate_content(prompt, stream=True):
+            try:
+                chunk_text = chunk.text
+            except ValueError:
+                continue
+            
+            for item in stream_parser.feed(chunk_text):
+                parsed_item = self._parse_batch_item(item, article_count)
+                if parsed_item:
+                    on_item(*parsed_item)
+        
+        return stream_parser.text
+    
+    def _build_sentiment_result(self, sentiment_data: Dict, article: Dict) -> SentimentResult:
+        """Build a SentimentResult from parsed sentiment data and its source article."""
+        return SentimentResult(
+            sentiment=sentiment_data['sentiment'],
+            reasoning=sentiment_data['reasoning'],
+            confidence=sentiment_data.get('confidence', 0.8),
+            article_title=article.get('title', ''),
+            article_source=article.get('source', 'Unknown')
+        )
+    
+    def _cache_key(self, *parts: str) -> str:
+        """
+        Build a compact cache key from a hash of the given parts.
+        
+        The model name and generation settings are always part of the key, so
+        switching either never serves responses produced under the old ones.
+        """
+        return hashlib.blake2b(
+            "|".join((self._cache_namespace,) + parts).encode('utf-8'), digest_size=16
+        ).hexdigest()
+    
+    def _article_cache_key(self, article: Dict) -> str:
+        """Build the cache key for an article from the hash of its analysis prompt."""
+        return self._cache_key('article', self._create_analysis_prompt(self._clean_article_text(article)))
+    
+    def _batch_article_cache_key(self, article: Dict) -> str:
+        """
+        Build the cache key for a batch-produced verdict on an article.
+        
+        The key hashes the batch prompt rendered for the article alone, so a
+        change to the batch template invalidates these entries, and they never
+        mix with verdicts from the single-article prompt.
+        """
+        return self._cache_key('batch_article', self._create_batch_analysis_prompt([article]))
+    
+    def _clean_article_text(self, article: Dict) -> str:
+        """
+        Build the compact text block for an article that is embedded in prompts.
+        
+        Collapses whitespace, strips markup and NewsAPI truncation markers,
+        drops a title repeated at the start of the content and caps the content
+        at MAX_CONTENT_CHARS to keep the prompt small.
+        
+        Args:
+            article: Article data with title, description, content, etc.
+            
+        Returns:
+            Cleaned article text
+        """
+        title = self._normalize_text(article.get('title') or '')
+        description = self._normalize_text(article.get('description') or '')
+        content = self._normalize_text(_TRUNCATION_MARKER_RE.sub('', article.get('content') or ''))
+        
+        if title and content.lower().startswith(title.lower()):
+            content = content[len(title):].lstrip(' -:|')
+        
+        content = content[:MAX_CONTENT_CHARS]
+        
+        return f"Title: {title}\n\nDescription: {description}\n\nContent: {content}"
+    
+    def _normalize_text(self, text: str) -> str:
+        """Unescape entities, strip HTML tags and collapse whitespace."""
+        text = _HTML_TAG_RE.sub(' ', html.unescape(text))
+        return _WHITESPACE_RE.sub(' ', text).strip()
+    
     def _create_analysis_prompt(self, article_text: str) -> str:
         """
         Create the prompt for article sentiment analysis.
@@ -123,15 +658,119 @@ class SentimentAnalyzer:
         Returns:
             Formatted prompt string
         """
+        return self._prompt_template.format(text=article_text)
+
+    def _parse_sentiment_response(self, response_text: str) -> Optional[Dict]:
+        """
+        Parse the sentiment analysis response from Gemini.
+        
+        Args:
+            response_text: Raw response text from Gemini
+            
+        Returns:
+            Parsed sentiment data or None if parsing fails
+        """
+        try:
+            sentiment_data = self._extract_json(response_text, ('sentiment', 'reasoning'))
+            
+            if not sentiment_data:
+                return None
+
+            sentiment = str(sentiment_data['sentiment']).strip().title()
+            if sentiment not in ['Positive', 'Negative', 'Neutral']:
+                logger.warning(f"Invalid sentiment value: {sentiment}")
+                return None
+            
+            return {
+                'sentiment': sentiment,
+                'reasoning': str(sentiment_data['reasoning']).strip(),
+                'confidence': self._coerce_confidence(sentiment_data.get('confidence', 0.8))
+            }
+            
+        except Exception as e:
+            logger.error(f"Error parsing sentiment response: {str(e)}")
+            return None
+    
+    def _extract_json(self, response_text: str, required_keys: Tuple[str, ...] = ()) -> Optional[Dict]:
+        """
+        Extract and decode the JSON object embedded in a Gemini response.
+        
+        A ```json fenced block is preferred; only when there is none does the
+        outermost {...} span of the text get decoded.
+        
+        Args:
+            response_text: Raw response text from Gemini
+            required_keys: Keys that must be present in the decoded object
+            
+        Returns:
+            Decoded JSON object or None if it is missing, invalid or incomplete
+        """
+        match = _JSON_FENCE_RE.search(response_text)
+        if match:
+            json_text = match.group(1)
+        else:
+            match = _JSON_OBJECT_RE.search(response_text)
+            if not match:
+                logger.warning("No JSON found in response")
+                return None
+            json_text = match.group(0)
+        
+        try:
+            data = orjson.loads(json_text)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"JSON parsing error: {str(e)}")
+            return None
+        
+        if not isinstance(data, dict) or any(key not in data for key in required_keys):
+            logger.warning(f"Missing required fields in response: {', '.join(required_keys)}")
+            return None
+        
+        return data
+    
+    def _create_batch_analysis_prompt(self, articles: List[Dict], 
+                                      company_name: Optional[str] = None) -> str:
+        """
+        Create the prompt for analyzing several articles in one request.
+        
+        Args:
+            articles: List of articles to analyze
+            company_name: When given, the prompt also asks for Bull/Bear cases
+            
+        Returns:
+            Formatted prompt string with numbered articles
+        """
+        articles_text = "\n\n".join(
+            f"Article {article_id}:\n{self._clean_article_text(article)}"
+            for article_id, article in enumerate(articles, start=1)
+        )
+        
+        if company_name:
+            summary_instructions = f"""
+5. Based on your per-article analysis, create 3-5 compelling Bull Case points and 3-5 concerning Bear Case points for {company_name}
+6. Focus the Bull/Bear points on investment implications and market impact, and be specific and actionable"""
+            summary_schema = """,
+    "bull_case": [
+        "Point 1 about positive developments",
+        "Point 2 about growth opportunities",
+        "Point 3 about competitive advantages"
+    ],
+    "bear_case": [
+        "Point 1 about risks and challenges",
+        "Point 2 about market concerns",
+        "Point 3 about potential headwinds"
+    ]"""
+        else:
+            summary_instructions = ""
+            summary_schema = ""
+        
         return f"""You are a senior financial analyst with expertise in market sentiment analysis. 
-Analyze the following news article from an investor's perspective and determine its sentiment regarding the company.
+Analyze each of the following {len(articles)} news articles from an investor's perspective and determine its sentiment regarding the company.
 
-Article Text:
-{article_text}
+{articles_text}
 
 Instructions:
-1. Determine the overall sentiment as either "Positive", "Negative", or "Neutral"
-2. Provide clear reasoning for your sentiment classification
+1. For every article, determine the overall sentiment as either "Positive", "Negative", or "Neutral"
+2. Provide clear reasoning for each sentiment classification
 3. Consider factors like:
    - Financial performance implications
    - Market impact potential
@@ -139,73 +778,108 @@ Instructions:
    - Regulatory or competitive threats
    - Growth prospects
    - Risk factors
+4. Analyze each article independently and return exactly one result per article, using its article number as the "id"{summary_instructions}
 
 Return your analysis in the following JSON format:
 {{
-    "sentiment": "Positive/Negative/Neutral",
-    "reasoning": "Detailed explanation of your sentiment analysis",
-    "confidence": 0.85
+    "per_article": [
+        {{
+            "id": 1,
+            "sentiment": "Positive/Negative/Neutral",
+            "reasoning": "Detailed explanation of your sentiment analysis",
+            "confidence": 0.85
+        }}
+    ]{summary_schema}
 }}
 
 Be objective and focus on investment implications rather than general news sentiment."""
 
-    def _parse_sentiment_response(self, response_text: str) -> Optional[Dict]:
+    def _parse_batch_response(self, response_text: str, article_count: int) -> Optional[Dict]:
         """
-        Parse the sentiment analysis response from Gemini.
+        Parse the batch sentiment analysis response from Gemini.
         
         Args:
             response_text: Raw response text from Gemini
+            article_count: Number of articles sent in the batch
             
         Returns:
-            Parsed sentiment data or None if parsing fails
+            Dictionary with 'per_article' (article id to sentiment data),
+            'bull_case' and 'bear_case' lists, or None if parsing fails
         """
         try:
-            cleaned_text = response_text.strip()
-
-            if '```json' in cleaned_text:
-                json_start = cleaned_text.find('```json') + 7
-                json_end = cleaned_text.find('```', json_start)
-                json_text = cleaned_text[json_start:json_end].strip()
-            elif '{' in cleaned_text and '}' in cleaned_text:
-                json_start = cleaned_text.find('{')
-                json_end = cleaned_text.rfind('}') + 1
-                json_text = cleaned_text[json_start:json_end]
-            else:
-                logger.warning("No JSON found in response")
-                return None
-            
-            sentiment_data = json.loads(json_text)
+            batch_data = self._extract_json(response_text, ('per_article',))
             
-            if 'sentiment' not in sentiment_data or 'reasoning' not in sentiment_data:
-                logger.warning("Missing required fields in sentiment response")
-                return None
-
-            sentiment = sentiment_data['sentiment'].strip().title()
-            if sentiment not in ['Positive', 'Negative', 'Neutral']:
-                logger.warning(f"Invalid sentiment value: {sentiment}")
+            if not batch_data:
                 return None
             
+            per_article = {}
+            for item in batch_data.get('per_article', []):
+                parsed_item = self._parse_batch_item(item, article_count)
+                if parsed_item:
+                    article_id, sentiment_data = parsed_item
+                    per_article[article_id] = sentiment_data
+            
             return {
-                'sentiment': sentiment,
-                'reasoning': sentiment_data['reasoning'].strip(),
-                'confidence': sentiment_data.get('confidence', 0.8)
+                'per_article': per_article,
+                'bull_case': [str(point) for point in batch_data.get('bull_case') or []],
+                'bear_case': [str(point) for point in batch_data.get('bear_case') or []]
             }
             
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error: {str(e)}")
-            return None
         except Exception as e:
-            logger.error(f"Error parsing sentiment response: {str(e)}")
+            logger.error(f"Error parsing batch response: {str(e)}")
+            return None
+    
+    def _parse_batch_item(self, item, article_count: int) -> Optional[Tuple[int, Dict]]:
+        """
+        Validate a single per-article entry of a batch response.
+        
+        Args:
+            item: Decoded entry from the "per_article" array
+            article_count: Number of articles sent in the batch
+            
+        Returns:
+            Tuple of (article_id, sentiment_data) or None if the entry is invalid
+        """
+        if not isinstance(item, dict):
+            return None
+        
+        try:
+            article_id = int(item.get('id'))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid article id in batch response: {item.get('id')}")
+            return None
+        
+        if article_id < 1 or article_id > article_count:
+            logger.warning(f"Article id out of range in batch response: {article_id}")
+            return None
+        
+        if 'sentiment' not in item or 'reasoning' not in item:
+            logger.warning(f"Missing required fields for article {article_id} in batch response")
             return None
+        
+        sentiment = str(item['sentiment']).strip().title()
+        if sentiment not in ['Positive', 'Negative', 'Neutral']:
+            logger.warning(f"Invalid sentiment value for article {article_id}: {sentiment}")
+            return None
+        
+        return article_id, {
+            'sentiment': sentiment,
+            'reasoning': str(item['reasoning']).strip(),
+            'confidence': self._coerce_confidence(item.get('confidence', 0.8))
+        }
     
     def generate_final_report(self, sentiment_results: List[SentimentResult], 
-                            company_name: str) -> SentimentReport:
+                            company_name: str,
+                            bull_bear_cases: Optional[Tuple[List[str], List[str]]] = None) -> SentimentReport:
         """
         Generate final sentiment report from individual article analyses.
         
         Args:
             sentiment_results: List of SentimentResult objects
             company_name: Name of the company being analyzed
+            bull_bear_cases: Pre-generated (bull_case, bear_case) points, e.g. from
+                analyze_articles_fused; when missing or empty they are generated
+                with a separate Gemini request
             
         Returns:
             SentimentReport object with comprehensive analysis
@@ -216,50 +890,80 @@ Be objective and focus on investment implications rather than general news senti
             if not sentiment_results:
                 return self._create_empty_report(company_name)
             
-            sentiments = [result.sentiment for result in sentiment_results]
-            sentiment_counts = Counter(sentiments)
+            sentiments = pd.Series([result.sentiment for result in sentiment_results])
+            sentiment_counts = sentiments.value_counts()
             
             total_articles = len(sentiment_results)
-            sentiment_percentages = {
-                sentiment: (count / total_articles) * 100 
-                for sentiment, count in sentiment_counts.items()
-            }
             
-            overall_sentiment = self._determine_overall_sentiment(sentiment_percentages)
+            overall_sentiment, weighted_percentages = self._determine_overall_sentiment(sentiment_results)
+            sentiment_percentages = pd.Series(
+                [weighted_percentages[sentiment] for sentiment in sentiment_counts.index],
+                index=sentiment_counts.index
+            )
             
-            bull_case, bear_case = self._generate_bull_bear_cases(sentiment_results, company_name)
+            if bull_bear_cases and all(bull_bear_cases):
+                bull_case, bear_case = bull_bear_cases
+            else:
+                bull_case, bear_case = self._generate_bull_bear_cases(sentiment_results, company_name)
             
             return SentimentReport(
                 overall_sentiment=overall_sentiment,
-                sentiment_breakdown=dict(sentiment_counts),
-                sentiment_percentages=sentiment_percentages,
+                sentiment_breakdown=sentiment_counts.to_dict(),
+                sentiment_percentages=sentiment_percentages.to_dict(),
                 bull_case=bull_case,
                 bear_case=bear_case,
                 total_articles=total_articles,
                 analyzed_articles=len(sentiment_results),
-                analysis_timestamp=time.strftime("%Y-%m-%d %H:%M:%S")
+                analysis_timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+                sentiment_df=pd.DataFrame({
+                    'Sentiment': sentiment_counts.index,
+                    'Count': sentiment_counts.values,
+                    'Percentage': sentiment_percentages.values
+                })
             )
             
         except Exception as e:
             logger.error(f"Error generating final report: {str(e)}")
             return self._create_empty_report(company_name)
     
-    def _determine_overall_sentiment(self, sentiment_percentages: Dict[str, float]) -> str:
+    def _determine_overall_sentiment(self, sentiment_results: List[SentimentResult]) -> Tuple[str, Dict[str, float]]:
         """
-        Determine overall sentiment based on percentages.
+        Determine overall sentiment from confidence-weighted article verdicts.
         
         Args:
-            sentiment_percentages: Dictionary of sentiment percentages
+            sentiment_results: List of sentiment analysis results
             
         Returns:
-            Overall sentiment classification
+            Tuple of (overall sentiment classification, confidence-weighted
+            percentage per sentiment label)
         """
-        max_sentiment = max(sentiment_percentages.items(), key=lambda x: x[1])
+        codes = np.empty(len(sentiment_results), dtype=np.int8)
+        confidences = np.empty(len(sentiment_results), dtype=np.float32)
+        for i, result in enumerate(sentiment_results):
+            codes[i] = SENTIMENT_CODES[result.sentiment]
+            confidences[i] = self._coerce_confidence(result.confidence)
         
-        if max_sentiment[1] < 40:
-            return "Neutral"
+        overall_code, percentages = aggregate_sentiment(codes, confidences)
+        weighted_percentages = {label: float(percentages[code]) for code, label in enumerate(SENTIMENT_LABELS)}
+        return SENTIMENT_LABELS[overall_code], weighted_percentages
+    
+    def _coerce_confidence(self, confidence) -> float:
+        """
+        Convert a model-reported confidence to a float in [0, 1].
         
-        return max_sentiment[0]
+        Values above 1 (e.g. 85 or "85%") are read as percentages; anything
+        that is not a number (e.g. "high") falls back to 0.8.
+        """
+        try:
+            value = float(str(confidence).strip().rstrip('%'))
+        except (TypeError, ValueError):
+            return 0.8
+        
+        if math.isnan(value):
+            return 0.8
+        if value > 1:
+            value /= 100
+        return min(max(value, 0.0), 1.0)
     
     def _generate_bull_bear_cases(self, sentiment_results: List[SentimentResult], 
                                  company_name: str) -> Tuple[List[str], List[str]]:
@@ -283,6 +987,16 @@ Be objective and focus on investment implications rather than general news senti
                 if result.sentiment == 'Negative'
             ]
             
+            cache_key = self._cache_key(
+                'bull_bear', company_name,
+                *sorted(self._cache_key(reason) for reason in positive_reasoning), '',
+                *sorted(self._cache_key(reason) for reason in negative_reasoning)
+            )
+            cached = self.cache.get(cache_key)
+            if cached:
+                logger.info(f"Using cached Bull/Bear cases for {company_name}")
+                return cached
+            
             prompt = self._create_bull_bear_prompt(
                 company_name, positive_reasoning, negative_reasoning
             )
@@ -296,7 +1010,9 @@ Be objective and focus on investment implications rather than general news senti
             bull_bear_data = self._parse_bull_bear_response(response.text)
             
             if bull_bear_data:
-                return bull_bear_data['bull_case'], bull_bear_data['bear_case']
+                bull_bear_cases = (bull_bear_data['bull_case'], bull_bear_data['bear_case'])
+                self.cache.set(cache_key, bull_bear_cases, expire=self.cache_ttl)
+                return bull_bear_cases
             else:
                 return self._create_default_bull_bear_cases(sentiment_results)
                 
@@ -340,43 +1056,21 @@ Return in this JSON format:
 
     def _parse_bull_bear_response(self, response_text: str) -> Optional[Dict]:
         """Parse Bull/Bear case response from Gemini."""
-        try:
-            cleaned_text = response_text.strip()
-            
-            if '```json' in cleaned_text:
-                json_start = cleaned_text.find('```json') + 7
-                json_end = cleaned_text.find('```', json_start)
-                json_text = cleaned_text[json_start:json_end].strip()
-            elif '{' in cleaned_text and '}' in cleaned_text:
-                json_start = cleaned_text.find('{')
-                json_end = cleaned_text.rfind('}') + 1
-                json_text = cleaned_text[json_start:json_end]
-            else:
-                return None
-            
-            return json.loads(json_text)
-            
-        except Exception as e:
-            logger.error(f"Error parsing Bull/Bear response: {str(e)}")
-            return None
+        return self._extract_json(response_text, ('bull_case', 'bear_case'))
     
     def _create_default_bull_bear_cases(self, sentiment_results: List[SentimentResult]) -> Tuple[List[str], List[str]]:
         """Create default Bull/Bear cases when AI generation fails."""
-        bull_case = []
-        bear_case = []
+        buckets = {'Positive': [], 'Negative': []}
         
         for result in sentiment_results:
-            if result.sentiment == 'Positive':
-                bull_case.append(f"• {result.reasoning[:100]}...")
-            elif result.sentiment == 'Negative':
-                bear_case.append(f"• {result.reasoning[:100]}...")
+            bucket = buckets.get(result.sentiment)
+            if bucket is not None and len(bucket) < 5:
+                bucket.append(f"• {result.reasoning[:100]}...")
         
-        if not bull_case:
-            bull_case = ["• Positive market sentiment detected in recent news"]
-        if not bear_case:
-            bear_case = ["• Some concerns identified in recent coverage"]
+        bull_case = buckets['Positive'] or ["• Positive market sentiment detected in recent news"]
+        bear_case = buckets['Negative'] or ["• Some concerns identified in recent coverage"]
         
-        return bull_case[:5], bear_case[:5]
+        return bull_case, bear_case
     
     def _create_empty_report(self, company_name: str) -> SentimentReport:
         """Create an empty report when no data is available."""
@@ -388,5 +1082,6 @@ Return in this JSON format:
             bear_case=["• No recent news available for analysis"],
             total_articles=0,
             analyzed_articles=0,
-            analysis_timestamp=time.strftime("%Y-%m-%d %H:%M:%S")
+            analysis_timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+            sentiment_df=pd.DataFrame({'Sentiment': ["Neutral"], 'Count': [0], 'Percentage': [100.0]})
         )
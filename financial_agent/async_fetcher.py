@@ -0,0 +1,187 @@
+"""
+Async Data Fetcher Module
+
+Handles fetching news for many companies concurrently with aiohttp.
+"""
+
+import logging
+import asyncio
+import aiohttp
+from typing import List, Dict, Optional
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from financial_agent.cache import cached, coalesced
+from financial_agent.data_fetcher import DataFetcher, NEWS_CACHE_TTL, NEWS_API_MAX_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+CONNECTOR_LIMIT = 16
+DNS_CACHE_TTL = 300
+NEWS_API_TIMEOUT = aiohttp.ClientTimeout(total=30)
+HTTP_HEADERS = {'User-Agent': 'Financial-Sentiment-Analyst/1.0'}
+
+class AsyncDataFetcher(DataFetcher):
+    """
+    DataFetcher variant that talks to NewsAPI through aiohttp.
+    
+    Use it as an async context manager to reuse one connector across many
+    requests; outside the context each call opens a short-lived session.
+    """
+    
+    def __init__(self, news_api_key: str):
+        """
+        Initialize the AsyncDataFetcher.
+        
+        Args:
+            news_api_key: NewsAPI.org API key
+        """
+        super().__init__(news_api_key)
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._news_semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def __aenter__(self) -> "AsyncDataFetcher":
+        """Open the pooled aiohttp session used by the async methods."""
+        connector = aiohttp.TCPConnector(limit=CONNECTOR_LIMIT, ttl_dns_cache=DNS_CACHE_TTL)
+        self._http = aiohttp.ClientSession(
+            connector=connector,
+            headers=HTTP_HEADERS
+        )
+        self._news_semaphore = asyncio.Semaphore(NEWS_API_MAX_CONCURRENCY)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the pooled aiohttp session."""
+        await self._http.close()
+        self._http = None
+        self._news_semaphore = None
+    
+    @coalesced
+    def fetch_news_from_api(self, company_name: str, days_back: int = 5,
+                            max_articles: Optional[int] = None) -> List[Dict]:
+        """
+        Fetch recent news articles from NewsAPI (blocking wrapper).
+        
+        Args:
+            company_name: Name of the company to fetch news for
+            days_back: Number of days to look back for news
+            max_articles: Stop after this many valid articles (None for all)
+        
+        Returns:
+            List of news articles with relevant metadata
+        """
+        return asyncio.run(self.fetch_news_from_api_async(company_name, days_back, max_articles))
+    
+    def fetch_news_batch(self, companies: List[str], days_back: int = 5) -> Dict[str, List[Dict]]:
+        """
+        Fetch recent news articles for several companies (blocking wrapper).
+        
+        Args:
+            companies: Names of the companies to fetch news for
+            days_back: Number of days to look back for news
+        
+        Returns:
+            Dictionary mapping each company name to its list of articles
+        """
+        return asyncio.run(self.fetch_news_batch_async(companies, days_back))
+    
+    @cached(ttl=NEWS_CACHE_TTL)
+    async def fetch_news_from_api_async(self, company_name: str, days_back: int = 5,
+                                        max_articles: Optional[int] = None) -> List[Dict]:
+        """
+        Fetch recent news articles from NewsAPI without blocking the event loop.
+        
+        Args:
+            company_name: Name of the company to fetch news for
+            days_back: Number of days to look back for news
+            max_articles: Stop after this many valid articles (None for all)
+        
+        Returns:
+            List of news articles with relevant metadata
+        """
+        try:
+            logger.info(f"Fetching news for: {company_name}")
+            
+            params = self._build_news_params(company_name, days_back)
+            
+            data = await self._request_news_async(params)
+            
+            return self._process_news_data(data, company_name, max_articles)
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Request error fetching news: {str(e)}")
+            return []
+        except Exception as e:
+            logger.error(f"Error fetching news for {company_name}: {str(e)}")
+            return []
+    
+    async def _request_news_async(self, params: Dict) -> Dict:
+        """
+        Send the NewsAPI request on the pooled session, or a temporary one
+        when the fetcher is used outside its async context.
+        
+        Args:
+            params: Query parameters for the everything endpoint
+        
+        Returns:
+            Decoded JSON response
+        """
+        if self._http is None:
+            async with aiohttp.ClientSession(headers=HTTP_HEADERS) as session:
+                return await self._get_json(session, params)
+        
+        async with self._news_semaphore:
+            return await self._get_json(self._http, params)
+    
+    async def _get_json(self, session: aiohttp.ClientSession, params: Dict) -> Dict:
+        """GET the NewsAPI endpoint and decode the JSON body."""
+        async with session.get(self.news_base_url, params=params, timeout=NEWS_API_TIMEOUT) as response:
+            response.raise_for_status()
+            return await response.json(loads=json_loads)
+    
+    async def fetch_news_batch_async(self, companies: List[str], days_back: int = 5) -> Dict[str, List[Dict]]:
+        """
+        Fetch recent news articles for several companies concurrently.
+        
+        Args:
+            companies: Names of the companies to fetch news for
+            days_back: Number of days to look back for news
+        
+        Returns:
+            Dictionary mapping each company name to its list of articles
+        """
+        if self._http is None:
+            async with self:
+                return await self.fetch_news_batch_async(companies, days_back)
+        
+        results = await asyncio.gather(
+            *[self.fetch_news_from_api_async(company, days_back) for company in companies]
+        )
+        return dict(zip(companies, results))
+    
+    async def get_ticker_async(self, company_name: str) -> Optional[str]:
+        """
+        Map company name to stock ticker symbol in a worker thread.
+        
+        Args:
+            company_name: Name of the company to search for
+        
+        Returns:
+            Ticker symbol if found, None otherwise
+        """
+        return await asyncio.to_thread(self.get_ticker, company_name)
+    
+    async def get_company_info_async(self, ticker: str) -> Optional[Dict]:
+        """
+        Get basic company information from yfinance in a worker thread.
+        
+        Args:
+            ticker: Stock ticker symbol
+        
+        Returns:
+            Dictionary with company information
+        """
+        return await asyncio.to_thread(self.get_company_info, ticker)
@@ -0,0 +1,247 @@
+"""
+Cache Module
+
+Handles persistent on-disk caching of API responses with per-entry TTLs,
+and coalescing of identical calls that are in flight at the same time.
+"""
+
+import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+import inspect
+import logging
+import functools
+import tempfile
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".cache"
+
+_inflight: Dict[Tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a cache entry, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str).encode("utf-8")
+
+def _loads(data: bytes) -> Any:
+    """Deserialize a cache entry, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class FileCache:
+    """Stores JSON-serializable values as files under a cache directory."""
+    
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        Initialize the FileCache.
+        
+        Args:
+            cache_dir: Root directory for cache files
+        """
+        self.cache_dir = cache_dir
+    
+    def _path(self, key: str) -> str:
+        """Map a cache key to its file path."""
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Read a cached value if it exists and is fresh.
+        
+        Args:
+            key: Cache key (may contain '/' to group entries in subdirectories)
+            ttl: Maximum age of the entry in seconds
+        
+        Returns:
+            Cached value, or None if it is missing, expired or unreadable
+        """
+        try:
+            with open(self._path(key), "rb") as fh:
+                entry = _loads(fh.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read cache entry {key}: {str(e)}")
+            return None
+        
+        if time.time() - entry.get("ts", 0) > ttl:
+            return None
+        
+        return entry.get("data")
+    
+    def set(self, key: str, value: Any):
+        """
+        Store a value in the cache.
+        
+        The entry is written to a temporary file and moved into place with
+        os.replace, so readers never see a partially written file.
+        
+        Args:
+            key: Cache key (may contain '/' to group entries in subdirectories)
+            value: JSON-serializable value to store
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(_dumps({"ts": time.time(), "data": value}))
+                os.replace(tmp_path, path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not write cache entry {key}: {str(e)}")
+
+default_cache = FileCache()
+
+def _slugify(value: Any) -> str:
+    """Turn a ticker or company name into a safe directory name."""
+    slug = re.sub(r"[^a-z0-9]+", "_", str(value).lower()).strip("_")
+    return slug or "_"
+
+def _bind_arguments(signature: inspect.Signature, self, args: tuple, kwargs: dict) -> Tuple[tuple, dict]:
+    """
+    Normalize a method call's arguments for use in a cache or in-flight key.
+    
+    Binding to the signature and applying defaults makes
+    ``f('X', 7)``, ``f('X', days_back=7)`` and ``f('X')`` (when 7 is the
+    default) produce the same arguments.
+    
+    Returns:
+        Tuple of (positional arguments without self, keyword-only arguments)
+    """
+    bound = signature.bind(self, *args, **kwargs)
+    bound.apply_defaults()
+    return bound.args[1:], bound.kwargs
+
+def cached(ttl: float, cache: Optional[FileCache] = None) -> Callable:
+    """
+    Cache the return value of a DataFetcher method on disk.
+    
+    Entries are stored as ``{first_arg}/{method}-{md5}.json`` where the md5 is
+    taken over the method name and its arguments, normalized against the
+    signature so positional, keyword and defaulted spellings share an entry. Empty results (None, [] or
+    {}) are not cached, so failed lookups are retried on the next call.
+    Coroutine methods are supported and get an async wrapper.
+    
+    Args:
+        ttl: Seconds a cached result stays valid
+        cache: FileCache to use; defaults to the shared ``.cache`` directory
+    
+    Returns:
+        Method decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        
+        def make_key(args: tuple, kwargs: dict) -> str:
+            digest = hashlib.md5(
+                json.dumps([func.__name__, args, kwargs], sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest()
+            group = _slugify(args[0]) if args else "_"
+            return f"{group}/{func.__name__}-{digest}"
+        
+        def lookup(key: str, args: tuple) -> Optional[Any]:
+            value = (cache or default_cache).get(key, ttl)
+            if value is not None:
+                logger.info(f"Using cached {func.__name__} result for {args[0] if args else ''}")
+            return value
+        
+        def store(key: str, value: Any):
+            if value:
+                (cache or default_cache).set(key, value)
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                args, kwargs = _bind_arguments(signature, self, args, kwargs)
+                key = make_key(args, kwargs)
+                value = lookup(key, args)
+                if value is not None:
+                    return value
+                
+                value = await func(self, *args, **kwargs)
+                store(key, value)
+                return value
+            
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            args, kwargs = _bind_arguments(signature, self, args, kwargs)
+            key = make_key(args, kwargs)
+            value = lookup(key, args)
+            if value is not None:
+                return value
+            
+            value = func(self, *args, **kwargs)
+            store(key, value)
+            return value
+        
+        return wrapper
+    
+    return decorator
+
+def coalesced(func: Callable) -> Callable:
+    """
+    Share one in-flight call between concurrent callers with the same arguments.
+    
+    The first caller runs the method; callers arriving while it is still
+    running wait for its result (or exception) instead of issuing an
+    identical request. Apply it outside ``cached`` so the cache lookup is
+    also done only once.
+    
+    Args:
+        func: Method to wrap; its arguments must be hashable
+    
+    Returns:
+        Wrapped method
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        args, kwargs = _bind_arguments(signature, self, args, kwargs)
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+        
+        with _inflight_lock:
+            future = _inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                _inflight[key] = future
+        
+        if not is_leader:
+            logger.info(f"Joining in-flight {func.__name__} call for {args[0] if args else ''}")
+            return future.result()
+        
+        try:
+            result = func(self, *args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+    
+    return wrapper
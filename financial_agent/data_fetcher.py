@@ -4,19 +4,208 @@ Data Fetcher Module
 Handles fetching company data, news articles, and ticker symbol mapping.
 """
 
+import os
+import re
+import json
 import logging
+import asyncio
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import aiohttp
+import ijson
 import requests
-import yfinance as yf
-from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator, IO
 from datetime import datetime, timedelta
+from difflib import SequenceMatcher
+from itertools import islice
+from types import MappingProxyType
+from urllib.parse import quote
 import time
 
-logging.basicConfig(level=logging.INFO)
+from financial_agent.cache import cached, coalesced
+
 logger = logging.getLogger(__name__)
 
+NEWS_CACHE_TTL = 24 * 3600
+COMPANY_INFO_CACHE_TTL = 7 * 24 * 3600
+TICKER_CACHE_TTL = 30 * 24 * 3600
+
+NEWS_API_MAX_CONCURRENCY = 8
+_NEWS_API_SEMAPHORE = threading.Semaphore(NEWS_API_MAX_CONCURRENCY)
+
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+YAHOO_MAX_QUOTE_SYMBOLS = 20
+YAHOO_QUOTE_SUMMARY_URL = "https://query2.finance.yahoo.com/v10/finance/quoteSummary/{symbol}"
+YAHOO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+}
+YAHOO_UNAUTHORIZED_STATUS_CODES = (401, 403)
+YAHOO_UNAUTHORIZED_BACKOFF = 3600
+
+_yahoo_unauthorized_at = 0.0
+
+def _mark_yahoo_unauthorized(status: int):
+    """Remember that Yahoo rejected a request made without its cookie and crumb."""
+    global _yahoo_unauthorized_at
+    if not _yahoo_raw_api_blocked():
+        logger.info(f"Yahoo quote API returned HTTP {status} (no crumb); "
+                    f"using yfinance search for the next {YAHOO_UNAUTHORIZED_BACKOFF}s")
+    _yahoo_unauthorized_at = time.time()
+
+def _yahoo_raw_api_blocked() -> bool:
+    """Whether the crumb-less quote endpoints were rejected recently and should be skipped."""
+    return time.time() - _yahoo_unauthorized_at < YAHOO_UNAUTHORIZED_BACKOFF
+
+def _create_shared_session() -> requests.Session:
+    """
+    Create the pooled HTTP session shared by all DataFetcher instances.
+    
+    Transient failures (connection errors, HTTP 429 and 5xx) are retried by
+    urllib3 inside the adapter with exponential backoff, honoring any
+    Retry-After header. Other 4xx responses are returned as-is and surface
+    through raise_for_status.
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Financial-Sentiment-Analyst/1.0'
+    })
+    retries = Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=RETRYABLE_STATUS_CODES,
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+_SHARED_SESSION = _create_shared_session()
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+TICKERS_PATH = os.path.join(DATA_DIR, 'tickers.json')
+TICKERS_SEED_PATH = os.path.join(DATA_DIR, 'tickers_seed.json')
+COMPANY_SUFFIXES = frozenset({
+    'inc', 'incorporated', 'corp', 'corporation', 'co', 'company', 'ltd', 'limited',
+    'plc', 'llc', 'lp', 'holdings', 'group', 'sa', 'ag', 'nv', 'se', 'com'
+})
+
+def _normalize_company_name(name: str) -> str:
+    """
+    Normalize a company name for ticker table lookups.
+    
+    Lowercases the name, drops SEC state-of-incorporation markers such as
+    "/DE/", strips punctuation, and removes a leading "the", the word "and"
+    and trailing legal suffixes like "inc", "corp" or "ltd".
+    
+    Args:
+        name: Company name as typed by the user or listed by the SEC
+        
+    Returns:
+        Normalized name, e.g. "Tesla, Inc." -> "tesla"
+    """
+    name = name.lower().split('/')[0].replace("'", "").replace("\u2019", "")
+    tokens = [token for token in re.findall(r'[a-z0-9]+', name) if token != 'and']
+    
+    if tokens and tokens[0] == 'the':
+        tokens = tokens[1:]
+    while len(tokens) > 1 and tokens[-1] in COMPANY_SUFFIXES:
+        tokens.pop()
+    
+    return ' '.join(tokens)
+
+def _load_ticker_map(path: Optional[str] = None) -> Dict[str, str]:
+    """
+    Load the company-name-to-ticker table.
+    
+    By default this is tickers.json, the full SEC list written by
+    scripts/refresh_tickers.py. When it has not been generated, the small
+    hand-picked tickers_seed.json of well-known companies is used instead,
+    and every other name falls through to the network lookups.
+    
+    The file lists the largest companies first, so when two names
+    normalize to the same key the bigger listing wins.
+    
+    Args:
+        path: Path to a ticker table file (defaults as described above)
+        
+    Returns:
+        Dictionary mapping normalized company names to ticker symbols
+    """
+    if path is None:
+        if os.path.exists(TICKERS_PATH):
+            path = TICKERS_PATH
+        else:
+            logger.info("tickers.json not found; using the seed ticker table. "
+                        "Run scripts/refresh_tickers.py to build the full SEC table")
+            path = TICKERS_SEED_PATH
+    
+    try:
+        with open(path, 'r', encoding='utf-8') as fh:
+            tickers = json.load(fh)
+    except Exception as e:
+        logger.warning(f"Could not load ticker table {path}: {str(e)}")
+        return {}
+    
+    ticker_map = {}
+    for name, symbol in tickers.items():
+        ticker_map.setdefault(_normalize_company_name(name), symbol)
+    return ticker_map
+
+_TICKER_MAP = _load_ticker_map()
+
+_yf = None
+
+def _yfinance():
+    """Import yfinance on first use; it pulls in pandas and numpy at import time."""
+    global _yf
+    if _yf is None:
+        import yfinance
+        _yf = yfinance
+    return _yf
+
+def _quote_type_symbol(data: Dict) -> Optional[str]:
+    """Extract the resolved symbol from a quoteSummary quoteType response."""
+    result = (data.get('quoteSummary') or {}).get('result') or []
+    if not result:
+        return None
+    
+    return (result[0].get('quoteType') or {}).get('symbol') or None
+
+@functools.lru_cache(maxsize=32)
+def _date_window(days_back: int, bucket_minute: int) -> Tuple[str, str]:
+    """
+    Format the NewsAPI from/to dates for a lookback window.
+    
+    Args:
+        days_back: Number of days to look back for news
+        bucket_minute: Current minute (``int(time.time() // 60)``); only used
+            as part of the cache key so the window is recomputed each minute
+    
+    Returns:
+        Tuple of (from_date, to_date) as YYYY-MM-DD strings
+    """
+    to_date = datetime.now()
+    from_date = to_date - timedelta(days=days_back)
+    return from_date.strftime('%Y-%m-%d'), to_date.strftime('%Y-%m-%d')
+
 class DataFetcher:
     """Handles data fetching from various APIs and sources."""
     
+    _BASE_PARAMS = MappingProxyType({
+        'sortBy': 'publishedAt',
+        'language': 'en',
+        'pageSize': 50,
+        'searchIn': 'title,description'
+    })
+    
     def __init__(self, news_api_key: str):
         """
         Initialize the DataFetcher.
@@ -26,14 +215,25 @@ class DataFetcher:
         """
         self.news_api_key = news_api_key
         self.news_base_url = "https://newsapi.org/v2/everything"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Financial-Sentiment-Analyst/1.0'
-        })
+        self.session = _SHARED_SESSION
     
+    @coalesced
+    @cached(ttl=TICKER_CACHE_TTL)
     def get_ticker(self, company_name: str) -> Optional[str]:
         """
-        Map company name to stock ticker symbol using yfinance.
+        Map company name to stock ticker symbol.
+        
+        Names in the local ticker table resolve without any network call.
+        For other names, all variations are first resolved with one
+        multi-symbol quote request, picking the entry whose name best matches
+        the company. If that returns nothing, the variations are probed
+        concurrently against Yahoo's quoteType endpoint. When every probe
+        comes back empty, yfinance's crumb-aware search is the last resort.
+        
+        Both raw endpoints are sent without Yahoo's cookie and crumb. Once
+        either answers 401/403, they are skipped for
+        YAHOO_UNAUTHORIZED_BACKOFF seconds and lookups go straight to the
+        yfinance search instead of paying for requests that will be rejected.
         
         Args:
             company_name: Name of the company to search for
@@ -44,29 +244,36 @@ class DataFetcher:
         try:
             logger.info(f"Searching for ticker symbol for: {company_name}")
             
-            ticker = yf.Ticker(company_name)
-            info = ticker.info
+            symbol = _TICKER_MAP.get(_normalize_company_name(company_name))
+            if symbol:
+                logger.info(f"Found ticker in local table: {symbol}")
+                return symbol
             
-            if info and 'symbol' in info and info['symbol']:
-                logger.info(f"Found ticker: {info['symbol']}")
-                return info['symbol']
-            
-            variations = [
+            variations = list(dict.fromkeys([
+                company_name,
                 company_name.upper(),
                 company_name.replace(" ", ""),
                 company_name.replace(" ", "."),
                 company_name.replace(" ", "-"),
-            ]
+            ]))
             
-            for variation in variations:
-                try:
-                    ticker = yf.Ticker(variation)
-                    info = ticker.info
-                    if info and 'symbol' in info and info['symbol']:
-                        logger.info(f"Found ticker with variation '{variation}': {info['symbol']}")
-                        return info['symbol']
-                except Exception:
-                    continue
+            if not _yahoo_raw_api_blocked():
+                quotes = self._bulk_quote(variations)
+                if quotes:
+                    symbol = self._best_quote_match(quotes, company_name)
+                    logger.info(f"Found ticker via bulk quote: {symbol}")
+                    return symbol
+            
+            if not _yahoo_raw_api_blocked():
+                symbol = asyncio.run(self._race_symbol_probes(variations))
+                if symbol:
+                    logger.info(f"Found ticker: {symbol}")
+                    return symbol
+            
+            symbol = self._yfinance_lookup(company_name)
+            if symbol:
+                logger.info(f"Found ticker via yfinance search: {symbol}")
+                return symbol
             
             logger.warning(f"Could not find ticker for: {company_name}")
             return None
@@ -75,60 +282,176 @@ class DataFetcher:
             logger.error(f"Error getting ticker for {company_name}: {str(e)}")
             return None
     
-    def fetch_news_from_api(self, company_name: str, days_back: int = 5) -> List[Dict]:
+    def _bulk_quote(self, symbols: List[str]) -> Dict[str, Dict]:
         """
-        Fetch recent news articles from NewsAPI.
+        Look up several symbols with a single Yahoo quote request.
         
         Args:
-            company_name: Name of the company to fetch news for
-            days_back: Number of days to look back for news
+            symbols: Candidate ticker symbols (at most 20 are sent)
             
         Returns:
-            List of news articles with relevant metadata
+            Dictionary mapping each symbol Yahoo knows to its quote data;
+            empty if the request fails
         """
         try:
-            logger.info(f"Fetching news for: {company_name}")
+            response = self.session.get(
+                YAHOO_QUOTE_URL,
+                params={'symbols': ",".join(symbols[:YAHOO_MAX_QUOTE_SYMBOLS])},
+                headers=YAHOO_HEADERS,
+                timeout=10
+            )
+            if response.status_code in YAHOO_UNAUTHORIZED_STATUS_CODES:
+                _mark_yahoo_unauthorized(response.status_code)
+                return {}
+            response.raise_for_status()
             
-            to_date = datetime.now()
-            from_date = to_date - timedelta(days=days_back)
-            
-            params = {
-                'q': f'"{company_name}"',
-                'from': from_date.strftime('%Y-%m-%d'),
-                'to': to_date.strftime('%Y-%m-%d'),
-                'sortBy': 'publishedAt',
-                'language': 'en',
-                'pageSize': 50,
-                'apiKey': self.news_api_key
-            }
+            results = (response.json().get('quoteResponse') or {}).get('result') or []
+            return {quote['symbol']: quote for quote in results if quote.get('symbol')}
             
-            response = self.session.get(self.news_base_url, params=params, timeout=30)
-            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Bulk quote lookup failed: {str(e)}")
+            return {}
+    
+    def _best_quote_match(self, quotes: Dict[str, Dict], company_name: str) -> str:
+        """
+        Pick the quote that best matches the requested company.
+        
+        Args:
+            quotes: Quote data keyed by symbol, as returned by _bulk_quote
+            company_name: Name the user searched for
+            
+        Returns:
+            Symbol of the best match
+        """
+        if company_name.upper() in quotes:
+            return company_name.upper()
+        
+        company_lower = company_name.lower()
+        
+        def name_similarity(symbol: str) -> float:
+            quote = quotes[symbol]
+            name = (quote.get('longName') or quote.get('shortName') or '').lower()
+            return SequenceMatcher(None, name, company_lower).ratio()
+        
+        return max(quotes, key=name_similarity)
+    
+    async def _race_symbol_probes(self, symbols: List[str]) -> Optional[str]:
+        """
+        Probe several candidate symbols concurrently and return the first hit.
+        
+        The race is abandoned as soon as a probe is rejected for lacking
+        Yahoo's crumb, since the remaining probes would be rejected too.
+        
+        Args:
+            symbols: Candidate ticker symbols to probe
             
-            data = response.json()
+        Returns:
+            First resolved ticker symbol, or None if no probe succeeds
+        """
+        timeout = aiohttp.ClientTimeout(total=5)
+        async with aiohttp.ClientSession(headers=YAHOO_HEADERS, timeout=timeout) as session:
+            tasks = [asyncio.create_task(self._probe(session, symbol)) for symbol in symbols]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    symbol = await next_done
+                    if symbol:
+                        return symbol
+                    if _yahoo_raw_api_blocked():
+                        return None
+            finally:
+                for task in tasks:
+                    task.cancel()
+        
+        return None
+    
+    async def _probe(self, session: aiohttp.ClientSession, symbol: str) -> Optional[str]:
+        """
+        Resolve a candidate symbol through Yahoo's quoteType module.
+        
+        Args:
+            session: Shared aiohttp session
+            symbol: Candidate ticker symbol
+            
+        Returns:
+            Resolved ticker symbol, or None if Yahoo does not know it
+        """
+        try:
+            url = YAHOO_QUOTE_SUMMARY_URL.format(symbol=quote(symbol, safe=''))
+            async with session.get(url, params={'modules': 'quoteType'}) as response:
+                if response.status == 404:
+                    return None
+                if response.status in YAHOO_UNAUTHORIZED_STATUS_CODES:
+                    _mark_yahoo_unauthorized(response.status)
+                    return None
+                if response.status != 200:
+                    logger.warning(f"Ticker probe for '{symbol}' returned HTTP {response.status}")
+                    return None
+                data = await response.json()
+            
+            return _quote_type_symbol(data)
+            
+        except Exception as e:
+            logger.warning(f"Ticker probe failed for '{symbol}': {str(e)}")
+            return None
+    
+    def _yfinance_lookup(self, company_name: str) -> Optional[str]:
+        """
+        Resolve a company name with yfinance's search as a last resort.
+        
+        Unlike the raw quote endpoints above, yfinance obtains and sends
+        Yahoo's cookie and crumb, and its search resolves plain company names
+        such as "Tata Motors" to exchange-suffixed symbols.
+        
+        Args:
+            company_name: Name of the company to search for
             
-            if data.get('status') != 'ok':
-                logger.error(f"NewsAPI error: {data.get('message', 'Unknown error')}")
-                return []
+        Returns:
+            Best matching ticker symbol, or None if nothing was found
+        """
+        try:
+            quotes = _yfinance().Search(company_name, max_results=5, news_count=0).quotes
+        except Exception as e:
+            logger.warning(f"yfinance search failed for '{company_name}': {str(e)}")
+            return None
+        
+        equities = [q for q in quotes if q.get('quoteType') == 'EQUITY'] or quotes
+        return equities[0].get('symbol') if equities else None
+    
+    @coalesced
+    @cached(ttl=NEWS_CACHE_TTL)
+    def fetch_news_from_api(self, company_name: str, days_back: int = 5,
+                            max_articles: Optional[int] = None) -> List[Dict]:
+        """
+        Fetch recent news articles from NewsAPI.
+        
+        Only articles mentioning the company in their title or description
+        are requested (searchIn=title,description). This trades some recall,
+        e.g. articles that only name the company in the body, for higher
+        precision and smaller responses.
+        
+        The response body is parsed incrementally, so only one raw article is
+        held in memory at a time and reading stops once max_articles valid
+        articles have been collected.
+        
+        Args:
+            company_name: Name of the company to fetch news for
+            days_back: Number of days to look back for news
+            max_articles: Stop after this many valid articles (None for all)
             
-            articles = data.get('articles', [])
-            logger.info(f"Fetched {len(articles)} articles for {company_name}")
+        Returns:
+            List of news articles with relevant metadata
+        """
+        try:
+            logger.info(f"Fetching news for: {company_name}")
             
-            processed_articles = []
-            for article in articles:
-                if self._is_valid_article(article, company_name):
-                    processed_articles.append({
-                        'title': article.get('title', ''),
-                        'description': article.get('description', ''),
-                        'content': article.get('content', ''),
-                        'url': article.get('url', ''),
-                        'publishedAt': article.get('publishedAt', ''),
-                        'source': article.get('source', {}).get('name', 'Unknown'),
-                        'urlToImage': article.get('urlToImage', '')
-                    })
+            params = self._build_news_params(company_name, days_back)
             
-            logger.info(f"Processed {len(processed_articles)} valid articles")
-            return processed_articles
+            with _NEWS_API_SEMAPHORE:
+                with self._request_news(params) as response:
+                    response.raw.decode_content = True
+                    return self._select_articles(
+                        self._iter_news_articles(response.raw), company_name, max_articles
+                    )
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error fetching news: {str(e)}")
@@ -137,34 +460,185 @@ class DataFetcher:
             logger.error(f"Error fetching news for {company_name}: {str(e)}")
             return []
     
-    def _is_valid_article(self, article: Dict, company_name: str) -> bool:
+    def _build_news_params(self, company_name: str, days_back: int) -> Dict:
+        """
+        Build the NewsAPI query parameters for a company.
+        
+        Args:
+            company_name: Name of the company to fetch news for
+            days_back: Number of days to look back for news
+            
+        Returns:
+            Query parameters for the everything endpoint
+        """
+        from_date, to_date = _date_window(days_back, int(time.time() // 60))
+        
+        return {
+            **self._BASE_PARAMS,
+            'q': f'"{company_name}"',
+            'from': from_date,
+            'to': to_date,
+            'apiKey': self.news_api_key
+        }
+    
+    def _process_news_data(self, data: Dict, company_name: str,
+                           max_articles: Optional[int] = None) -> List[Dict]:
+        """
+        Turn a decoded NewsAPI response body into the list of relevant articles.
+        
+        Args:
+            data: Decoded JSON response from NewsAPI
+            company_name: Company the articles were fetched for
+            max_articles: Stop after this many valid articles (None for all)
+            
+        Returns:
+            List of news articles with relevant metadata
+        """
+        if data.get('status') != 'ok':
+            logger.error(f"NewsAPI error: {data.get('message', 'Unknown error')}")
+            return []
+        
+        articles = data.get('articles', [])
+        logger.info(f"Fetched {len(articles)} articles for {company_name}")
+        
+        return self._select_articles(articles, company_name, max_articles)
+    
+    def _iter_news_articles(self, stream: IO[bytes]) -> Iterator[Dict]:
+        """
+        Yield the articles of a NewsAPI response body one at a time.
+        
+        Args:
+            stream: File-like object with the raw JSON response
+            
+        Yields:
+            Raw article dictionaries; nothing if NewsAPI reports an error
+        """
+        events = ijson.parse(stream)
+        status = None
+        message = None
+        
+        for prefix, event, value in events:
+            if prefix == 'status':
+                status = value
+            elif prefix == 'message':
+                message = value
+            elif prefix == 'articles.item' and event == 'start_map' and status == 'ok':
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                for prefix, event, value in events:
+                    builder.event(event, value)
+                    if prefix == 'articles.item' and event == 'end_map':
+                        break
+                yield builder.value
+        
+        if status != 'ok':
+            logger.error(f"NewsAPI error: {message or 'Unknown error'}")
+    
+    def _select_articles(self, articles: Iterable[Dict], company_name: str,
+                         max_articles: Optional[int] = None) -> List[Dict]:
+        """
+        Keep the valid articles and project them to the fields we use.
+        
+        Args:
+            articles: Raw NewsAPI articles (a list or a lazy iterator)
+            company_name: Company the articles were fetched for
+            max_articles: Stop after this many valid articles (None for all)
+            
+        Returns:
+            List of news articles with relevant metadata
+        """
+        valid_articles = (
+            {
+                'title': article['title'],
+                'description': article['description'],
+                'content': article.get('content', ''),
+                'url': article.get('url', ''),
+                'publishedAt': article.get('publishedAt', ''),
+                'source': (article.get('source') or {}).get('name', 'Unknown'),
+                'urlToImage': article.get('urlToImage', '')
+            }
+            for article in articles
+            if self._is_valid_article(article)
+        )
+        processed_articles = list(islice(valid_articles, max_articles))
+        
+        logger.info(f"Processed {len(processed_articles)} valid articles for {company_name}")
+        return processed_articles
+    
+    def _request_news(self, params: Dict) -> requests.Response:
         """
-        Check if an article is valid and relevant.
+        Send the NewsAPI request.
+        
+        Args:
+            params: Query parameters for the everything endpoint
+            
+        Returns:
+            Successful HTTP response with the body not yet read
+        """
+        response = self.session.get(self.news_base_url, params=params, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        return response
+    
+    def fetch_news_batch(self, companies: List[str], days_back: int = 5) -> Dict[str, List[Dict]]:
+        """
+        Fetch recent news articles for several companies concurrently.
+        
+        Args:
+            companies: Names of the companies to fetch news for
+            days_back: Number of days to look back for news
+            
+        Returns:
+            Dictionary mapping each company name to its list of articles
+        """
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=NEWS_API_MAX_CONCURRENCY) as executor:
+            futures = {
+                executor.submit(self.fetch_news_from_api, company, days_back): company
+                for company in companies
+            }
+            for future in as_completed(futures):
+                company = futures[future]
+                try:
+                    results[company] = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching news for {company}: {str(e)}")
+                    results[company] = []
+        
+        return results
+    
+    def _is_valid_article(self, article: Dict) -> bool:
+        """
+        Check if an article is complete enough to analyze.
+        
+        Relevance is not re-checked here: the query uses
+        searchIn=title,description, so NewsAPI only returns articles that
+        mention the company in their title or description.
         
         Args:
             article: Article data from NewsAPI
-            company_name: Company name to check relevance against
             
         Returns:
-            True if article is valid and relevant
+            True if article has a title, a description and enough content
         """
         if not article.get('title') or not article.get('description'):
             return False
         
-        content = article.get('content', '')
-        if len(content) < 100:
-            return False
-        
-        text_to_check = f"{article.get('title', '')} {article.get('description', '')} {content}"
-        company_lower = company_name.lower()
-        text_lower = text_to_check.lower()
-        
-        return company_lower in text_lower
+        return len(article.get('content') or '') >= 100
     
+    @coalesced
+    @cached(ttl=COMPANY_INFO_CACHE_TTL)
     def get_company_info(self, ticker: str) -> Optional[Dict]:
         """
         Get basic company information using yfinance.
         
+        yfinance manages its own HTTP session (curl_cffi in recent releases,
+        which Yahoo requires), so the shared requests session is not passed in.
+        
         Args:
             ticker: Stock ticker symbol
             
@@ -174,24 +648,24 @@ class DataFetcher:
         try:
             logger.info(f"Fetching company info for ticker: {ticker}")
             
-            ticker_obj = yf.Ticker(ticker)
-            info = ticker_obj.info
+            info = _yfinance().Ticker(ticker).info
             
             if not info:
                 logger.warning(f"No info found for ticker: {ticker}")
                 return None
             
+            get = info.get
             company_info = {
-                'symbol': info.get('symbol', ticker),
-                'name': info.get('longName', info.get('shortName', 'Unknown')),
-                'sector': info.get('sector', 'Unknown'),
-                'industry': info.get('industry', 'Unknown'),
-                'market_cap': info.get('marketCap', 0),
-                'current_price': info.get('currentPrice', info.get('regularMarketPrice', 0)),
-                'currency': info.get('currency', 'USD'),
-                'country': info.get('country', 'Unknown'),
-                'website': info.get('website', ''),
-                'description': info.get('longBusinessSummary', '')
+                'symbol': get('symbol', ticker),
+                'name': get('longName') or get('shortName') or 'Unknown',
+                'sector': get('sector', 'Unknown'),
+                'industry': get('industry', 'Unknown'),
+                'market_cap': get('marketCap', 0),
+                'current_price': get('currentPrice') or get('regularMarketPrice') or 0,
+                'currency': get('currency', 'USD'),
+                'country': get('country', 'Unknown'),
+                'website': get('website', ''),
+                'description': get('longBusinessSummary', '')
             }
             
             logger.info(f"Successfully fetched info for {company_info['name']}")
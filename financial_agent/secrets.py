@@ -8,43 +8,40 @@ Priority: Environment variables > Direct configuration in this file
 import os
 from typing import Optional
 
+PLACEHOLDER_KEYS = frozenset({None, "//", "GEMINI_API", "NEWS_API"})
+
 class Config:
     """Configuration class for API keys and settings."""
     
     def __init__(self):
         self.google_ai_api_key: Optional[str] = os.getenv('GOOGLE_AI_API_KEY')
         self.news_api_key: Optional[str] = os.getenv('NEWS_API_KEY')
+        self._google_src = 'environment' if self.google_ai_api_key else 'secrets.py'
+        self._news_src = 'environment' if self.news_api_key else 'secrets.py'
         if not self.google_ai_api_key:
             self.google_ai_api_key = "//"  # Replace with your actual key
         if not self.news_api_key:
             self.news_api_key = "//"  # Replace with your actual key
+        
+        self._google_ok = self._is_configured(self.google_ai_api_key)
+        self._news_ok = self._is_configured(self.news_api_key)
+    
+    @staticmethod
+    def _is_configured(key: Optional[str]) -> bool:
+        """Check that a key is set and is not a placeholder."""
+        return key not in PLACEHOLDER_KEYS and len(key) > 10
     
     def validate_keys(self) -> bool:
         """Validate that all required API keys are set."""
-        return (
-            self.google_ai_api_key != "GEMINI_API" and
-            self.news_api_key != "NEWS_API" and
-            self.google_ai_api_key is not None and
-            self.news_api_key is not None and
-            len(self.google_ai_api_key) > 10 and  
-            len(self.news_api_key) > 10
-        )
+        return self._google_ok and self._news_ok
     
     def get_key_status(self) -> dict:
         """Get the status of API keys for debugging."""
         return {
-            'google_ai_configured': (
-                self.google_ai_api_key != "GEMINI_API" and 
-                self.google_ai_api_key is not None and 
-                len(self.google_ai_api_key) > 10
-            ),
-            'news_api_configured': (
-                self.news_api_key != "NEWS_API" and 
-                self.news_api_key is not None and 
-                len(self.news_api_key) > 10
-            ),
-            'google_ai_source': 'environment' if os.getenv('GOOGLE_AI_API_KEY') else 'secrets.py',
-            'news_api_source': 'environment' if os.getenv('NEWS_API_KEY') else 'secrets.py'
+            'google_ai_configured': self._google_ok,
+            'news_api_configured': self._news_ok,
+            'google_ai_source': self._google_src,
+            'news_api_source': self._news_src
         }
 
 config = Config()
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Refresh the bundled ticker lookup table.
+
+Downloads the SEC company ticker list (about 10k companies) and writes
+financial_agent/data/tickers.json as a {company name: ticker} mapping.
+DataFetcher prefers this file over the small tickers_seed.json shipped with
+the package. Run it periodically (e.g. from cron).
+
+The SEC requires automated clients to identify themselves with a real
+contact, so SEC_USER_AGENT must be set to "name email"; the script exits
+with an error when it is not.
+"""
+
+import os
+import sys
+import json
+import logging
+
+import requests
+
+SEC_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+TICKERS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'financial_agent', 'data', 'tickers.json'
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def fetch_sec_tickers(user_agent: str) -> dict:
+    """
+    Download the SEC ticker list.
+    
+    Args:
+        user_agent: User-Agent header identifying the requester
+    
+    Returns:
+        Dictionary mapping company names to ticker symbols, in SEC order
+        (largest companies first); the first listing of a name wins
+    """
+    response = requests.get(SEC_TICKERS_URL, headers={'User-Agent': user_agent}, timeout=30)
+    response.raise_for_status()
+    
+    tickers = {}
+    for entry in response.json().values():
+        tickers.setdefault(entry['title'], entry['ticker'])
+    return tickers
+
+def main() -> bool:
+    """Refresh tickers.json from the SEC list."""
+    user_agent = os.getenv('SEC_USER_AGENT', '').strip()
+    if not user_agent:
+        logger.error('SEC_USER_AGENT is not set. The SEC requires a real contact, '
+                     'e.g. SEC_USER_AGENT="Jane Doe jane@example.com"')
+        return False
+    
+    try:
+        tickers = fetch_sec_tickers(user_agent)
+    except Exception as e:
+        logger.error(f"Failed to download SEC ticker list: {str(e)}")
+        return False
+    
+    tmp_path = f"{TICKERS_PATH}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        json.dump(tickers, fh, indent=2)
+        fh.write("\n")
+    os.replace(tmp_path, TICKERS_PATH)
+    
+    logger.info(f"Wrote {len(tickers)} tickers to {TICKERS_PATH}")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -38,5 +38,6 @@ setup(
         ],
     },
     include_package_data=True,
+    package_data={"financial_agent": ["data/*.json"]},
     zip_safe=False,
 )
@@ -0,0 +1,164 @@
+"""
+Offline tests for the on-disk cache of Gemini verdicts.
+
+The Gemini model is replaced with a fake, so these tests do not touch the
+network and need no API keys.
+"""
+
+import sys
+import os
+import re
+import json
+import asyncio
+import threading
+from dataclasses import asdict
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from financial_agent import analyzer as analyzer_module
+from financial_agent.analyzer import SentimentAnalyzer, SentimentResult
+
+ARTICLES = [
+    {
+        'title': f'Apple headline {index}',
+        'description': f'Apple Inc. update {index}',
+        'content': 'Apple Inc. reported results. ' * 10,
+        'source': 'Test Source',
+        'url': f'https://example.com/{index}',
+        'publishedAt': '2024-01-15T10:00:00Z'
+    }
+    for index in range(1, 3)
+]
+
+class FakeChunk:
+    """Streamed Gemini chunk."""
+    
+    def __init__(self, text: str):
+        self.text = text
+
+class FakeBatchModel:
+    """Answers every streamed batch prompt with a Positive verdict per article."""
+    
+    def __init__(self):
+        self.prompts = []
+    
+    def generate_content(self, prompt, stream=False):
+        assert stream, "batch analysis should stream"
+        self.prompts.append(prompt)
+        article_count = len(re.findall(r"^Article \d+:", prompt, re.MULTILINE))
+        response_text = json.dumps({"per_article": [
+            {"id": article_id, "sentiment": "Positive", "reasoning": "Strong demand", "confidence": 0.9}
+            for article_id in range(1, article_count + 1)
+        ]})
+        return iter([FakeChunk(response_text)])
+
+class FakeRestResponse:
+    """aiohttp response stand-in carrying one Gemini REST verdict."""
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def raise_for_status(self):
+        pass
+    
+    async def json(self):
+        text = json.dumps({"sentiment": "Negative", "reasoning": "Weak guidance", "confidence": 0.7})
+        return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+
+class FakeRestSession:
+    """aiohttp.ClientSession stand-in that records the prompts it is sent."""
+    
+    prompts = []
+    
+    def __init__(self, **kwargs):
+        pass
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def post(self, url, headers=None, json=None):
+        self.prompts.append(json['contents'][0]['parts'][0]['text'])
+        return FakeRestResponse()
+
+class ThreadRecordingCache:
+    """Wraps a cache and records which thread every call runs on."""
+    
+    def __init__(self, cache):
+        self._cache = cache
+        self.threads = []
+    
+    def get(self, key):
+        self.threads.append(threading.get_ident())
+        return self._cache.get(key)
+    
+    def set(self, key, value, expire=None):
+        self.threads.append(threading.get_ident())
+        return self._cache.set(key, value, expire=expire)
+
+@pytest.fixture
+def analyzer(tmp_path):
+    analyzer = SentimentAnalyzer("test-key", cache_dir=str(tmp_path / "sentiment_cache"))
+    analyzer.model = FakeBatchModel()
+    return analyzer
+
+def test_batch_verdicts_are_cached_under_batch_prompt_keys(analyzer):
+    """Batch verdicts are reused by later batches but never served to the single-article path."""
+    first = analyzer.analyze_articles_batch(ARTICLES)
+    second = analyzer.analyze_articles_batch(ARTICLES)
+    
+    assert [result.sentiment for result in first] == ["Positive", "Positive"]
+    assert second == first
+    assert len(analyzer.model.prompts) == 1
+    
+    for article in ARTICLES:
+        assert analyzer.cache.get(analyzer._batch_article_cache_key(article))
+        assert analyzer.cache.get(analyzer._article_cache_key(article)) is None
+
+def test_batch_template_change_invalidates_cached_verdicts(analyzer, monkeypatch):
+    """Changing the batch prompt template makes the next batch re-analyze every article."""
+    analyzer.analyze_articles_batch(ARTICLES)
+    
+    original_prompt = analyzer._create_batch_analysis_prompt
+    monkeypatch.setattr(
+        analyzer, "_create_batch_analysis_prompt",
+        lambda articles, company_name=None: original_prompt(articles, company_name) + "\nBe concise."
+    )
+    analyzer.analyze_articles_batch(ARTICLES)
+    
+    assert len(analyzer.model.prompts) == 2
+    assert analyzer.model.prompts[1].endswith("Be concise.")
+    assert len(re.findall(r"^Article \d+:", analyzer.model.prompts[1], re.MULTILINE)) == len(ARTICLES)
+
+def test_async_analysis_keeps_cache_io_off_the_event_loop(analyzer, monkeypatch):
+    """Cached articles are not sent, and no cache call runs on the event loop thread."""
+    monkeypatch.setattr(analyzer_module, "aiohttp", SimpleNamespace(
+        TCPConnector=lambda **kwargs: None,
+        ClientTimeout=lambda **kwargs: None,
+        ClientSession=FakeRestSession
+    ))
+    monkeypatch.setattr(FakeRestSession, "prompts", [])
+    cached_result = SentimentResult("Positive", "Strong demand", 0.9, ARTICLES[0]['title'], 'Test Source')
+    analyzer.cache.set(analyzer._article_cache_key(ARTICLES[0]), asdict(cached_result))
+    analyzer.cache = ThreadRecordingCache(analyzer.cache)
+    
+    async def run():
+        return threading.get_ident(), await analyzer.analyze_articles_async(ARTICLES)
+    
+    loop_thread, results = asyncio.run(run())
+    
+    assert results[0] == cached_result
+    assert (results[1].sentiment, results[1].confidence) == ("Negative", 0.7)
+    assert len(FakeRestSession.prompts) == 1
+    assert ARTICLES[1]['title'] in FakeRestSession.prompts[0]
+    assert len(analyzer.cache.threads) == 3
+    assert loop_thread not in analyzer.cache.threads
+    assert analyzer.cache.get(analyzer._article_cache_key(ARTICLES[1]))
@@ -0,0 +1,134 @@
+"""
+Offline tests for the on-disk cache and in-flight call coalescing.
+
+These tests do not touch the network and need no API keys.
+"""
+
+import sys
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from financial_agent import cache as cache_module
+from financial_agent.cache import FileCache, cached, coalesced
+
+def test_file_cache_round_trip(tmp_path):
+    """Stored values are read back while fresh, leaving no temp files behind."""
+    file_cache = FileCache(str(tmp_path))
+    file_cache.set("apple_inc/get_ticker-abc", {"symbol": "AAPL"})
+    
+    assert file_cache.get("apple_inc/get_ticker-abc", ttl=60) == {"symbol": "AAPL"}
+    assert os.listdir(tmp_path / "apple_inc") == ["get_ticker-abc.json"]
+
+def test_file_cache_ttl_expiry(tmp_path, monkeypatch):
+    """Entries older than the TTL are treated as missing."""
+    file_cache = FileCache(str(tmp_path))
+    now = time.time()
+    monkeypatch.setattr(cache_module.time, "time", lambda: now)
+    file_cache.set("key", [1, 2, 3])
+    
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 30)
+    assert file_cache.get("key", ttl=60) == [1, 2, 3]
+    
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + 61)
+    assert file_cache.get("key", ttl=60) is None
+
+def test_file_cache_missing_and_corrupt_entries(tmp_path):
+    """Missing or unreadable entries return None instead of raising."""
+    file_cache = FileCache(str(tmp_path))
+    assert file_cache.get("missing", ttl=60) is None
+    
+    (tmp_path / "corrupt.json").write_bytes(b"{not json")
+    assert file_cache.get("corrupt", ttl=60) is None
+
+def test_cached_skips_empty_results_and_normalizes_arguments(tmp_path):
+    """Empty results are retried; positional, keyword and default spellings share one entry."""
+    file_cache = FileCache(str(tmp_path))
+    calls = []
+    
+    class Fetcher:
+        @cached(ttl=60, cache=file_cache)
+        def fetch(self, company_name, days_back=5):
+            calls.append((company_name, days_back))
+            return [] if company_name == "Unknown" else [company_name, days_back]
+    
+    fetcher = Fetcher()
+    assert fetcher.fetch("Apple", 5) == ["Apple", 5]
+    assert fetcher.fetch("Apple", days_back=5) == ["Apple", 5]
+    assert fetcher.fetch("Apple") == ["Apple", 5]
+    assert fetcher.fetch(company_name="Apple") == ["Apple", 5]
+    assert calls == [("Apple", 5)]
+    
+    fetcher.fetch("Unknown")
+    fetcher.fetch("Unknown")
+    assert calls.count(("Unknown", 5)) == 2
+
+def test_coalesced_followers_share_leader_result(caplog):
+    """Concurrent identical calls run the method once and all get its result."""
+    caplog.set_level(logging.INFO, logger="financial_agent.cache")
+    calls = []
+    release = threading.Event()
+    
+    class Fetcher:
+        @coalesced
+        def fetch(self, company_name, days_back=5):
+            calls.append(company_name)
+            release.wait(5)
+            return [company_name]
+    
+    fetcher = Fetcher()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(fetcher.fetch, "Apple") for _ in range(3)]
+        futures.append(executor.submit(fetcher.fetch, "Apple", days_back=5))
+        _wait_for_followers(caplog, len(futures) - 1)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+    
+    assert calls == ["Apple"]
+    assert results == [["Apple"]] * 4
+    assert not cache_module._inflight
+
+def test_coalesced_followers_share_leader_exception(caplog):
+    """An exception in the leader is raised in every follower, and the next call retries."""
+    caplog.set_level(logging.INFO, logger="financial_agent.cache")
+    calls = []
+    release = threading.Event()
+    
+    class Fetcher:
+        @coalesced
+        def fetch(self, company_name):
+            calls.append(company_name)
+            release.wait(5)
+            raise ValueError("boom")
+    
+    fetcher = Fetcher()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(fetcher.fetch, "Apple") for _ in range(3)]
+        _wait_for_followers(caplog, len(futures) - 1)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError, match="boom"):
+                future.result(timeout=5)
+    
+    assert calls == ["Apple"]
+    assert not cache_module._inflight
+    
+    with pytest.raises(ValueError):
+        fetcher.fetch("Apple")
+    assert calls == ["Apple", "Apple"]
+
+def _wait_for_followers(caplog, count: int, timeout: float = 5.0):
+    """Block until `count` callers have joined the in-flight call."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        joined = [record for record in caplog.records if "Joining in-flight" in record.getMessage()]
+        if len(joined) >= count:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"Expected {count} followers to join the in-flight call")
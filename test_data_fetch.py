@@ -2,16 +2,25 @@
 Test script for data fetching functionality.
 
 This script tests the data fetcher module to ensure all components
-are working correctly before running the main application.
+are working correctly before running the main application. Run it with
+pytest, or directly with python to execute the independent tests in
+parallel.
 """
 
 import sys
 import os
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
 from financial_agent.data_fetcher import DataFetcher
 from financial_agent.analyzer import SentimentAnalyzer
 
@@ -21,106 +30,82 @@ def get_config():
 
 config = get_config()
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+TEST_COMPANY = "Apple Inc."
+
+_fetcher = DataFetcher(config.news_api_key)
+_analyzer = SentimentAnalyzer(config.google_ai_api_key)
+
+def _require_keys():
+    """Skip tests that call external APIs when the keys are not configured."""
+    if not config.validate_keys():
+        pytest.skip("API keys are not configured")
+
+@pytest.fixture(scope="session")
+def data_fetcher():
+    _require_keys()
+    return _fetcher
+
+@pytest.fixture(scope="session")
+def analyzer():
+    _require_keys()
+    return _analyzer
+
+def _check_api_keys():
+    """Check that the API keys are properly configured."""
+    assert config.validate_keys(), (
+        "API keys are not properly configured. Set GOOGLE_AI_API_KEY and "
+        "NEWS_API_KEY, or update the keys in financial_agent/secrets.py"
+    )
+
 def test_api_keys():
     """Test if API keys are properly configured."""
-    print(" Testing API Key Configuration...")
-    
-    if not config.validate_keys():
-        print(" API keys are not properly configured!")
-        print("Please set the following environment variables:")
-        print("- GOOGLE_AI_API_KEY")
-        print("- NEWS_API_KEY")
-        print("\nOr update the keys in financial_agent/secrets.py")
-        return False
-    
-    print(" API keys are properly configured!")
-    return True
+    _require_keys()
+    _check_api_keys()
 
-def test_ticker_mapping():
+def test_ticker_mapping(data_fetcher):
     """Test ticker symbol mapping functionality."""
-    print("\n Testing Ticker Symbol Mapping...")
-    
-    data_fetcher = DataFetcher(config.news_api_key)
-    
-    test_companies = [
-        "Apple Inc.",
-        "Microsoft Corporation",
+    expected_tickers = {
+        "Apple Inc.": "AAPL",
+        "Microsoft Corporation": "MSFT",
+        "Tesla Inc.": "TSLA",
+    }
+    network_only_companies = [
         "Tata Motors",
         "Reliance Industries",
-        "Tesla Inc."
     ]
+    test_companies = list(expected_tickers) + network_only_companies
     
-    for company in test_companies:
-        print(f"  Testing: {company}")
-        ticker = data_fetcher.get_ticker(company)
-        if ticker:
-            print(f"     Found ticker: {ticker}")
-        else:
-            print(f"     No ticker found for {company}")
+    with ThreadPoolExecutor(max_workers=len(test_companies)) as executor:
+        tickers = dict(zip(test_companies, executor.map(data_fetcher.get_ticker, test_companies)))
     
-    return True
+    for company, expected in expected_tickers.items():
+        assert tickers[company] == expected, f"Expected {expected} for {company}, got {tickers[company]}"
+    
+    missing = [company for company in network_only_companies if not tickers[company]]
+    assert not missing, f"No ticker found for: {', '.join(missing)}"
 
-def test_news_fetching():
+def test_news_fetching(data_fetcher):
     """Test news article fetching functionality."""
-    print("\n Testing News Article Fetching...")
-    
-    data_fetcher = DataFetcher(config.news_api_key)
-    
-    test_company = "Apple Inc."
-    print(f"  Fetching news for: {test_company}")
-    
-    articles = data_fetcher.fetch_news_from_api(test_company, days_back=7)
+    articles = data_fetcher.fetch_news_from_api(TEST_COMPANY, days_back=7)
     
-    if articles:
-        print(f"     Found {len(articles)} articles")
-        
-        if articles:
-            first_article = articles[0]
-            print(f"    Sample article:")
-            print(f"      Title: {first_article.get('title', 'N/A')[:80]}...")
-            print(f"      Source: {first_article.get('source', 'N/A')}")
-            print(f"      Published: {first_article.get('publishedAt', 'N/A')}")
-    else:
-        print(f"     No articles found for {test_company}")
-        return False
-    
-    return True
+    assert articles, f"No articles found for {TEST_COMPANY}"
+    first_article = articles[0]
+    assert first_article['title']
+    assert first_article['source']
+    assert first_article['publishedAt']
 
-def test_company_info():
+def test_company_info(data_fetcher):
     """Test company information fetching."""
-    print("\n Testing Company Information Fetching...")
-    
-    data_fetcher = DataFetcher(config.news_api_key)
-    
-    test_ticker = "AAPL"
-    print(f"  Fetching company info for ticker: {test_ticker}")
-    
-    company_info = data_fetcher.get_company_info(test_ticker)
-    
-    if company_info:
-        print(f"     Company info retrieved:")
-        print(f"      Name: {company_info.get('name', 'N/A')}")
-        print(f"      Sector: {company_info.get('sector', 'N/A')}")
-        print(f"      Industry: {company_info.get('industry', 'N/A')}")
-        print(f"      Market Cap: ${company_info.get('market_cap', 0):,}")
-    else:
-        print(f"     No company info found for {test_ticker}")
-        return False
+    company_info = data_fetcher.get_company_info("AAPL")
     
-    return True
+    assert company_info, "No company info found for AAPL"
+    assert company_info['name'] != 'Unknown'
+    assert company_info['market_cap'] > 0
 
-def test_sentiment_analysis():
+def test_sentiment_analysis(analyzer):
     """Test sentiment analysis functionality."""
-    print("\n Testing Sentiment Analysis...")
-    
-    analyzer = SentimentAnalyzer(config.google_ai_api_key)
-    
     sample_article = {
         'title': 'Apple Reports Record Quarterly Revenue Growth',
         'description': 'Apple Inc. reported strong quarterly earnings with revenue exceeding expectations.',
@@ -130,101 +115,77 @@ def test_sentiment_analysis():
         'publishedAt': '2024-01-15T10:00:00Z'
     }
     
-    print("  Analyzing sample article...")
     result = analyzer.analyze_article_sentiment(sample_article)
     
-    if result:
-        print(f"      Sentiment analysis completed:")
-        print(f"      Sentiment: {result.sentiment}")
-        print(f"      Confidence: {result.confidence}")
-        print(f"      Reasoning: {result.reasoning[:100]}...")
-    else:
-        print(f"     Sentiment analysis failed")
-        return False
-    
-    return True
+    assert result, "Sentiment analysis failed"
+    assert result.sentiment in ('Positive', 'Negative', 'Neutral')
+    assert 0 <= result.confidence <= 1
+    assert result.reasoning
 
-def test_full_workflow():
+def test_full_workflow(data_fetcher, analyzer):
     """Test the complete workflow from company name to sentiment report."""
-    print("\n Testing Complete Workflow...")
-    
-    data_fetcher = DataFetcher(config.news_api_key)
-    analyzer = SentimentAnalyzer(config.google_ai_api_key)
-    
-    test_company = "Apple Inc."
-    print(f"  Testing complete workflow for: {test_company}")
+    ticker = data_fetcher.get_ticker(TEST_COMPANY)
+    assert ticker, "Failed to get ticker symbol"
     
-    print("    Step 1: Getting ticker symbol...")
-    ticker = data_fetcher.get_ticker(test_company)
-    if not ticker:
-        print("     Failed to get ticker symbol")
-        return False
-    print(f"     Ticker found: {ticker}")
-    
-    print("    Step 2: Getting company information...")
     company_info = data_fetcher.get_company_info(ticker)
-    if company_info:
-        print(f"     Company info retrieved: {company_info.get('name', 'N/A')}")
-    else:
-        print("      Company info not available (continuing anyway)")
+    if not company_info:
+        logger.warning("Company info not available (continuing anyway)")
     
-    print("    Step 3: Fetching news articles...")
-    articles = data_fetcher.fetch_news_from_api(test_company, days_back=7)
-    if not articles:
-        print("     No news articles found")
-        return False
-    print(f"     Found {len(articles)} articles")
-    
-    print("    Step 4: Analyzing sentiment...")
-    sentiment_results = []
-    for i, article in enumerate(articles[:3]):  
-        print(f"      Analyzing article {i+1}/{min(3, len(articles))}...")
-        result = analyzer.analyze_article_sentiment(article)
-        if result:
-            sentiment_results.append(result)
-    
-    if not sentiment_results:
-        print("     No sentiment analysis results")
-        return False
-    print(f"     Analyzed {len(sentiment_results)} articles")
+    articles = data_fetcher.fetch_news_from_api(TEST_COMPANY, days_back=7)
+    assert articles, "No news articles found"
     
-    print("    Step 5: Generating final report...")
-    report = analyzer.generate_final_report(sentiment_results, test_company)
-    print(f"     Report generated:")
-    print(f"      Overall Sentiment: {report.overall_sentiment}")
-    print(f"      Sentiment Breakdown: {report.sentiment_breakdown}")
-    print(f"      Bull Case Points: {len(report.bull_case)}")
-    print(f"      Bear Case Points: {len(report.bear_case)}")
+    sentiment_results = [
+        result for result in (analyzer.analyze_article_sentiment(article) for article in articles[:3])
+        if result
+    ]
+    assert sentiment_results, "No sentiment analysis results"
     
-    return True
+    report = analyzer.generate_final_report(sentiment_results, TEST_COMPANY)
+    assert report.overall_sentiment
+    assert sum(report.sentiment_breakdown.values()) == len(sentiment_results)
+
+def _run_test(test_func, *args) -> str:
+    """Run one test function outside pytest and return its outcome."""
+    try:
+        test_func(*args)
+        return "PASSED"
+    except AssertionError as e:
+        logger.error(f"{test_func.__name__} failed: {str(e)}")
+        return "FAILED"
+    except Exception as e:
+        logger.error(f"{test_func.__name__} failed with error: {str(e)}")
+        return f"ERROR: {str(e)}"
 
 def main():
-    """Run all tests."""
+    """Run all tests, executing the independent network tests in parallel."""
     print(" Financial Sentiment Analyst - Test Suite")
     print("=" * 50)
     
+    if _run_test(_check_api_keys) != "PASSED":
+        print(" API Key Configuration - FAILED")
+        print("Please set the following environment variables:")
+        print("- GOOGLE_AI_API_KEY")
+        print("- NEWS_API_KEY")
+        print("\nOr update the keys in financial_agent/secrets.py")
+        return False
+    print(" API Key Configuration - PASSED")
+    
     tests = [
-        ("API Key Configuration", test_api_keys),
-        ("Ticker Symbol Mapping", test_ticker_mapping),
-        ("News Article Fetching", test_news_fetching),
-        ("Company Information", test_company_info),
-        ("Sentiment Analysis", test_sentiment_analysis),
-        ("Complete Workflow", test_full_workflow)
+        ("Ticker Symbol Mapping", test_ticker_mapping, (_fetcher,)),
+        ("News Article Fetching", test_news_fetching, (_fetcher,)),
+        ("Company Information", test_company_info, (_fetcher,)),
+        ("Sentiment Analysis", test_sentiment_analysis, (_analyzer,)),
+        ("Complete Workflow", test_full_workflow, (_fetcher, _analyzer))
     ]
     
-    passed = 0
-    total = len(tests)
-    
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-                print(f" {test_name} - PASSED")
-            else:
-                print(f" {test_name} - FAILED")
-        except Exception as e:
-            print(f" {test_name} - ERROR: {str(e)}")
-            logger.error(f"Test {test_name} failed with error: {str(e)}")
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        outcomes = list(executor.map(lambda test: _run_test(test[1], *test[2]), tests))
+    
+    for (test_name, _, _), outcome in zip(tests, outcomes):
+        print(f" {test_name} - {outcome}")
+    
+    passed = 1 + outcomes.count("PASSED")
+    total = 1 + len(tests)
     
     print("\n" + "=" * 50)
     print(f"📊 Test Results: {passed}/{total} tests passed")
@@ -0,0 +1,244 @@
+"""
+Offline tests for the response parsers.
+
+Covers the streamed Gemini batch parser and the NewsAPI article stream,
+feeding them data split at arbitrary chunk boundaries, JSON extraction from
+Gemini responses and the validation of decoded verdicts. These tests do not touch the network and need
+no API keys.
+"""
+
+import sys
+import os
+import io
+import json
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from financial_agent.analyzer import SentimentAnalyzer, StreamingArrayParser
+from financial_agent.data_fetcher import DataFetcher
+
+PER_ARTICLE = [
+    {"id": 1, "sentiment": "Positive", "reasoning": "Revenue beat [estimates]", "confidence": 0.9},
+    {"id": 2, "sentiment": "Negative", "reasoning": "Margins fell, \"sharply\"", "confidence": 0.4},
+    {"id": 3, "sentiment": "Neutral", "reasoning": "{no change}", "confidence": 0.6},
+]
+
+BATCH_RESPONSE_TEXT = (
+    "```json\n"
+    + json.dumps({
+        "per_article": PER_ARTICLE,
+        "bull_case": ["Growth in services"],
+        "bear_case": ["Rising costs"]
+    }, indent=4)
+    + "\n```"
+)
+
+CONFIDENCE_CASES = [
+    (0.85, 0.85),
+    ("0.4", 0.4),
+    (85, 0.85),
+    ("85%", 0.85),
+    ("high", 0.8),
+    (None, 0.8),
+    (-0.5, 0.0),
+    (250, 1.0),
+]
+
+class ChunkedStream:
+    """Byte stream that returns at most `chunk_size` bytes per read, like a slow socket."""
+    
+    def __init__(self, data: bytes, chunk_size: int):
+        self._data = io.BytesIO(data)
+        self._chunk_size = chunk_size
+    
+    def read(self, size: int = -1) -> bytes:
+        return self._data.read(size if 0 <= size < self._chunk_size else self._chunk_size)
+
+def _article(index: int, valid: bool = True) -> dict:
+    """Build a NewsAPI article; invalid ones are missing their description."""
+    return {
+        "source": {"id": None, "name": f"Source {index}"},
+        "title": f"Apple headline {index}",
+        "description": f"Apple Inc. update {index}" if valid else None,
+        "content": "x" * 150,
+        "url": f"https://example.com/{index}",
+        "publishedAt": "2024-01-15T10:00:00Z",
+        "urlToImage": "",
+    }
+
+def _news_body(articles: list, status: str = "ok") -> bytes:
+    """Encode a NewsAPI everything response."""
+    if status != "ok":
+        return json.dumps({"status": status, "code": "rateLimited", "message": "Too many requests"}).encode("utf-8")
+    return json.dumps({"status": status, "totalResults": len(articles), "articles": articles}).encode("utf-8")
+
+class FakeChunk:
+    """Streamed Gemini chunk; a None text mimics a chunk without text parts."""
+    
+    def __init__(self, text):
+        self._text = text
+    
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            raise ValueError("chunk has no text")
+        return self._text
+
+class FakeStreamingModel:
+    """Stands in for the Gemini model, streaming a canned response in fixed-size chunks."""
+    
+    def __init__(self, response_text: str, chunk_size: int):
+        self.response_text = response_text
+        self.chunk_size = chunk_size
+    
+    def generate_content(self, prompt, stream=False):
+        assert stream
+        yield FakeChunk(None)
+        for start in range(0, len(self.response_text), self.chunk_size):
+            yield FakeChunk(self.response_text[start:start + self.chunk_size])
+
+@pytest.fixture
+def analyzer(tmp_path):
+    return SentimentAnalyzer("test-key", cache_dir=str(tmp_path / "sentiment_cache"))
+
+def test_streaming_array_parser_char_by_char():
+    """Entries are returned as soon as each one is complete, with none repeated."""
+    parser = StreamingArrayParser("per_article")
+    seen = []
+    completed_at = []
+    
+    for position, char in enumerate(BATCH_RESPONSE_TEXT):
+        items = parser.feed(char)
+        seen.extend(items)
+        completed_at.extend([position] * len(items))
+    
+    assert seen == PER_ARTICLE
+    assert parser.text == BATCH_RESPONSE_TEXT
+    assert all(BATCH_RESPONSE_TEXT[position] == '}' for position in completed_at)
+    assert completed_at == sorted(set(completed_at))
+    assert completed_at[-1] < BATCH_RESPONSE_TEXT.index('"bull_case"')
+
+def test_streaming_array_parser_stops_at_array_end():
+    """Text after the per_article array, including the Bull/Bear arrays, is never decoded as entries."""
+    for chunk_size in (1, 3, 7, 64, len(BATCH_RESPONSE_TEXT)):
+        parser = StreamingArrayParser("per_article")
+        seen = []
+        for start in range(0, len(BATCH_RESPONSE_TEXT), chunk_size):
+            seen.extend(parser.feed(BATCH_RESPONSE_TEXT[start:start + chunk_size]))
+        
+        assert seen == PER_ARTICLE, f"chunk_size={chunk_size}"
+        assert parser.feed('{"id": 4, "sentiment": "Positive"}') == []
+
+def test_streaming_array_parser_waits_for_key():
+    """Nothing is returned before the key appears, even if other objects stream first."""
+    parser = StreamingArrayParser("per_article")
+    assert parser.feed('{"summary": {"id": 9}, ') == []
+    assert parser.feed('"per_article": [') == []
+    assert parser.feed('{"id": 1, "sentiment": "Neutral"}, {"id": 2, "sent') == [{"id": 1, "sentiment": "Neutral"}]
+    assert parser.feed('iment": "Positive"}]}') == [{"id": 2, "sentiment": "Positive"}]
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 40])
+def test_stream_batch_response_emits_entries_while_streaming(analyzer, chunk_size):
+    """Each valid per_article entry reaches on_item as it streams; the full text is returned."""
+    analyzer.model = FakeStreamingModel(BATCH_RESPONSE_TEXT, chunk_size)
+    emitted = []
+    
+    response_text = analyzer._stream_batch_response("prompt", 3, lambda article_id, data: emitted.append((article_id, data)))
+    
+    assert response_text == BATCH_RESPONSE_TEXT
+    assert [article_id for article_id, _ in emitted] == [1, 2, 3]
+    assert [data["sentiment"] for _, data in emitted] == ["Positive", "Negative", "Neutral"]
+    
+    batch_data = analyzer._parse_batch_response(response_text, 3)
+    assert batch_data["per_article"] == dict(emitted)
+    assert batch_data["bull_case"] == ["Growth in services"]
+
+def test_iter_news_articles_across_chunk_boundaries():
+    """Articles are decoded correctly when the body arrives a few bytes at a time."""
+    fetcher = DataFetcher("test-key")
+    articles = [_article(index) for index in range(5)]
+    
+    for chunk_size in (1, 5, 13):
+        stream = ChunkedStream(_news_body(articles), chunk_size)
+        assert list(fetcher._iter_news_articles(stream)) == articles, f"chunk_size={chunk_size}"
+
+def test_iter_news_articles_error_status():
+    """An error response yields no articles."""
+    fetcher = DataFetcher("test-key")
+    stream = io.BytesIO(_news_body([], status="error"))
+    
+    assert list(fetcher._iter_news_articles(stream)) == []
+
+def test_select_articles_stops_at_max_articles():
+    """Selection stops pulling from the stream once max_articles valid articles are found."""
+    fetcher = DataFetcher("test-key")
+    articles = [_article(index, valid=index % 2 == 0) for index in range(40)]
+    pulled = []
+    
+    def tracked_articles():
+        for article in fetcher._iter_news_articles(io.BytesIO(_news_body(articles))):
+            pulled.append(article)
+            yield article
+    
+    selected = fetcher._select_articles(tracked_articles(), "Apple Inc.", max_articles=3)
+    
+    assert [article['title'] for article in selected] == [
+        "Apple headline 0", "Apple headline 2", "Apple headline 4"
+    ]
+    assert selected[0]['source'] == "Source 0"
+    assert len(pulled) == 5
+
+def test_select_articles_skips_invalid_articles():
+    """Articles without a description or with short content are dropped."""
+    fetcher = DataFetcher("test-key")
+    short_content = dict(_article(2), content="too short")
+    articles = [_article(0), _article(1, valid=False), short_content, _article(3)]
+    
+    selected = fetcher._select_articles(articles, "Apple Inc.")
+    
+    assert [article['url'] for article in selected] == ["https://example.com/0", "https://example.com/3"]
+
+@pytest.mark.parametrize("response_text", [
+    '```json\n{"sentiment": "Positive", "reasoning": "Beat {estimates}"}\n```',
+    '{"sentiment": "Positive", "reasoning": "Beat {estimates}"}',
+    'Here is my analysis:\n{"sentiment": "Positive", "reasoning": "Beat {estimates}"}\nHope this helps.',
+    'Scores use the {0, 1} scale.\n```json\n{"sentiment": "Positive", "reasoning": "Beat {estimates}"}\n```\nSee {notes}.',
+])
+def test_extract_json_finds_the_object(analyzer, response_text):
+    """Fenced, bare and prose-wrapped objects decode, even with braces in the surrounding prose."""
+    data = analyzer._extract_json(response_text, ('sentiment', 'reasoning'))
+    
+    assert data == {"sentiment": "Positive", "reasoning": "Beat {estimates}"}
+
+@pytest.mark.parametrize("response_text", [
+    "No JSON here",
+    '```json\n{"sentiment": "Positive", "reasoning": }\n```',
+    '{"sentiment": "Positive",}',
+    '{"sentiment": "Positive"}',
+])
+def test_extract_json_rejects_invalid_or_incomplete_objects(analyzer, response_text):
+    """Missing, malformed or incomplete objects yield None instead of raising."""
+    assert analyzer._extract_json(response_text, ('sentiment', 'reasoning')) is None
+
+@pytest.mark.parametrize("raw, expected", CONFIDENCE_CASES)
+def test_parse_sentiment_response_coerces_confidence(analyzer, raw, expected):
+    """Single-article verdicts always carry a float confidence in [0, 1]."""
+    response_text = json.dumps({"sentiment": "positive", "reasoning": " Strong quarter ", "confidence": raw})
+    
+    sentiment_data = analyzer._parse_sentiment_response(response_text)
+    
+    assert sentiment_data == {"sentiment": "Positive", "reasoning": "Strong quarter", "confidence": expected}
+    assert isinstance(sentiment_data["confidence"], float)
+
+@pytest.mark.parametrize("raw, expected", CONFIDENCE_CASES)
+def test_parse_batch_item_coerces_confidence(analyzer, raw, expected):
+    """Batch verdicts always carry a float confidence in [0, 1]."""
+    item = {"id": "2", "sentiment": "Negative", "reasoning": "Margins fell", "confidence": raw}
+    
+    article_id, sentiment_data = analyzer._parse_batch_item(item, article_count=3)
+    
+    assert article_id == 2
+    assert sentiment_data["confidence"] == pytest.approx(expected)
+    assert isinstance(sentiment_data["confidence"], float)
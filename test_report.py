@@ -0,0 +1,93 @@
+"""
+Offline tests for sentiment aggregation and the final report.
+
+These tests do not touch the network and need no API keys.
+"""
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from financial_agent.analyzer import (
+    SentimentAnalyzer, SentimentResult, SENTIMENT_CODES, NEUTRAL_CODE, aggregate_sentiment
+)
+
+BULL_BEAR_CASES = (["• Strong demand"], ["• Rising costs"])
+
+@pytest.fixture
+def analyzer(tmp_path):
+    return SentimentAnalyzer("test-key", cache_dir=str(tmp_path / "sentiment_cache"))
+
+def _results(*verdicts) -> list:
+    """Build SentimentResults from (sentiment, confidence) pairs."""
+    return [
+        SentimentResult(
+            sentiment=sentiment,
+            reasoning=f"{sentiment} reasoning {index}",
+            confidence=confidence,
+            article_title=f"Headline {index}",
+            article_source="Test Source"
+        )
+        for index, (sentiment, confidence) in enumerate(verdicts)
+    ]
+
+def test_aggregate_sentiment_weights_by_confidence():
+    """Two confident positives outweigh three weak negatives."""
+    codes = np.array([SENTIMENT_CODES['Positive']] * 2 + [SENTIMENT_CODES['Negative']] * 3)
+    confidences = np.array([0.95, 0.95, 0.3, 0.3, 0.3])
+    
+    overall_code, percentages = aggregate_sentiment(codes, confidences)
+    
+    assert overall_code == SENTIMENT_CODES['Positive']
+    assert percentages[SENTIMENT_CODES['Positive']] == pytest.approx(1.9 / 2.8 * 100)
+    assert percentages[SENTIMENT_CODES['Negative']] == pytest.approx(0.9 / 2.8 * 100)
+    assert percentages[SENTIMENT_CODES['Neutral']] == 0
+    assert percentages.sum() == pytest.approx(100)
+
+def test_aggregate_sentiment_below_threshold_is_neutral():
+    """No label reaching the threshold share gives a Neutral verdict."""
+    codes = np.array([SENTIMENT_CODES['Positive'], SENTIMENT_CODES['Negative'], SENTIMENT_CODES['Neutral']])
+    
+    overall_code, percentages = aggregate_sentiment(codes, np.array([0.5, 0.5, 0.5]))
+    
+    assert overall_code == NEUTRAL_CODE
+    assert percentages == pytest.approx([100 / 3] * 3)
+
+def test_aggregate_sentiment_all_zero_confidences():
+    """Zero total weight gives a Neutral verdict with zero shares instead of dividing by zero."""
+    codes = np.array([SENTIMENT_CODES['Positive'], SENTIMENT_CODES['Negative']])
+    
+    overall_code, percentages = aggregate_sentiment(codes, np.zeros(2))
+    
+    assert overall_code == NEUTRAL_CODE
+    assert not percentages.any()
+
+def test_report_percentages_match_verdict(analyzer):
+    """The reported percentages are the weighted shares the verdict was based on."""
+    results = _results(('Positive', 0.95), ('Positive', 0.95), ('Negative', 0.3), ('Negative', 0.3), ('Negative', 0.3))
+    
+    report = analyzer.generate_final_report(results, "Apple Inc.", BULL_BEAR_CASES)
+    
+    assert report.overall_sentiment == 'Positive'
+    assert report.sentiment_breakdown == {'Negative': 3, 'Positive': 2}
+    assert report.sentiment_percentages == pytest.approx({'Positive': 1.9 / 2.8 * 100, 'Negative': 0.9 / 2.8 * 100})
+    assert max(report.sentiment_percentages, key=report.sentiment_percentages.get) == report.overall_sentiment
+    assert sum(report.sentiment_percentages.values()) == pytest.approx(100)
+    assert list(report.sentiment_df['Percentage']) == pytest.approx(
+        [report.sentiment_percentages[label] for label in report.sentiment_df['Sentiment']]
+    )
+    assert (report.bull_case, report.bear_case) == BULL_BEAR_CASES
+
+def test_report_with_all_zero_confidences(analyzer):
+    """All-zero confidences give a Neutral report without failing."""
+    results = _results(('Positive', 0.0), ('Negative', 0.0))
+    
+    report = analyzer.generate_final_report(results, "Apple Inc.", BULL_BEAR_CASES)
+    
+    assert report.overall_sentiment == 'Neutral'
+    assert report.analyzed_articles == 2
+    assert report.sentiment_percentages == {'Positive': 0.0, 'Negative': 0.0}
@@ -0,0 +1,107 @@
+"""
+Offline tests for ticker resolution.
+
+Yahoo and yfinance are replaced with fakes, so these tests do not touch the
+network and need no API keys.
+"""
+
+import sys
+import os
+import json
+import importlib.util
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from financial_agent import cache as cache_module
+from financial_agent import data_fetcher as data_fetcher_module
+from financial_agent.cache import FileCache
+from financial_agent.data_fetcher import DataFetcher
+
+class FakeResponse:
+    """Minimal requests.Response stand-in."""
+    
+    def __init__(self, status_code: int, payload=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+    
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+    
+    def json(self):
+        return self._payload
+
+class FakeSession:
+    """Records GET requests and answers them all with one canned response."""
+    
+    def __init__(self, response: FakeResponse):
+        self.response = response
+        self.urls = []
+    
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return self.response
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "default_cache", FileCache(str(tmp_path / "cache")))
+    monkeypatch.setattr(data_fetcher_module, "_yahoo_unauthorized_at", 0.0)
+    return DataFetcher("test-key")
+
+def test_unauthorized_quote_skips_probes(fetcher, monkeypatch):
+    """A 401 from the quote endpoint goes straight to yfinance search, now and on later lookups."""
+    fetcher.session = FakeSession(FakeResponse(401))
+    probed = []
+    searched = []
+    
+    async def fake_race(symbols):
+        probed.append(symbols)
+        return None
+    
+    def fake_lookup(company_name):
+        searched.append(company_name)
+        return "ZYXWV.NS"
+    
+    monkeypatch.setattr(fetcher, "_race_symbol_probes", fake_race)
+    monkeypatch.setattr(fetcher, "_yfinance_lookup", fake_lookup)
+    
+    assert fetcher.get_ticker("Zyxwv Motors") == "ZYXWV.NS"
+    assert fetcher.get_ticker("Qwerty Industries Bangalore") == "ZYXWV.NS"
+    
+    assert fetcher.session.urls == [data_fetcher_module.YAHOO_QUOTE_URL]
+    assert probed == []
+    assert searched == ["Zyxwv Motors", "Qwerty Industries Bangalore"]
+
+def test_bulk_quote_match_without_fallbacks(fetcher, monkeypatch):
+    """A successful bulk quote picks the best name match and skips the other lookups."""
+    fetcher.session = FakeSession(FakeResponse(200, {"quoteResponse": {"result": [
+        {"symbol": "ACME", "longName": "Acme Widgets Incorporated"},
+        {"symbol": "ACMEX", "longName": "Acme Exploration"},
+    ]}}))
+    monkeypatch.setattr(fetcher, "_yfinance_lookup", lambda company_name: pytest.fail("unexpected search"))
+    
+    assert fetcher.get_ticker("Acme Widgets") == "ACME"
+    assert not data_fetcher_module._yahoo_raw_api_blocked()
+
+def test_ticker_table_prefers_generated_file(tmp_path, monkeypatch):
+    """A generated tickers.json is used when present; otherwise the seed table is."""
+    monkeypatch.setattr(data_fetcher_module, "TICKERS_PATH", str(tmp_path / "tickers.json"))
+    seed_map = data_fetcher_module._load_ticker_map()
+    assert seed_map["apple"] == "AAPL"
+    
+    (tmp_path / "tickers.json").write_text(json.dumps({"Acme Widgets, Inc.": "ACME"}), encoding="utf-8")
+    assert data_fetcher_module._load_ticker_map() == {"acme widgets": "ACME"}
+
+def test_refresh_tickers_requires_user_agent(monkeypatch):
+    """The refresh script refuses to contact the SEC without a real User-Agent."""
+    spec = importlib.util.spec_from_file_location(
+        "refresh_tickers", os.path.join(os.path.dirname(os.path.abspath(__file__)), "scripts", "refresh_tickers.py")
+    )
+    refresh_tickers = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(refresh_tickers)
+    monkeypatch.delenv("SEC_USER_AGENT", raising=False)
+    monkeypatch.setattr(refresh_tickers, "fetch_sec_tickers", lambda user_agent: pytest.fail("unexpected download"))
+    
+    assert refresh_tickers.main() is False